@@ -4,6 +4,7 @@ from pathlib import Path
 from services.ai_service import AIService
 from services.file_service import FileService
 from engines.spec_engine import SpecEngine
+from utils import json_utils
 
 # Configure Streamlit page
 st.set_page_config(
@@ -643,80 +644,47 @@ def show_diagrams():
     # Placeholder for diagram generation
     st.info("Diagram generation functionality will be implemented in upcoming tasks")
 
+# Labels and acceptance criteria added to every generated JIRA ticket
+KIRO_TICKET_LABELS = ("kiro-generated", "implementation")
+STANDARD_ACCEPTANCE_CRITERIA = (
+    "Code review passed",
+    "Unit tests written and passing",
+    "Documentation updated"
+)
+
 def generate_jira_templates(parsed_tasks, issue_type, priority, project_key, add_labels, assignee="", epic_link="", story_points="", components="", fix_versions="", affects_versions=""):
     """Generate production-grade JIRA ticket templates in different formats"""
-    import json
     import csv
     from io import StringIO
     from datetime import datetime, timedelta
     
-    # Prepare template data with comprehensive JIRA fields
-    template_data = []
-    
-    for i, task in enumerate(parsed_tasks, 1):
-        labels = ["kiro-generated", "implementation"] if add_labels else []
-        
-        # Estimate story points based on task complexity
-        estimated_points = len(task.get("subtasks", [])) + 2 if not story_points else story_points
-        
-        # Create comprehensive ticket data
-        ticket_data = {
-            # Core fields
-            "summary": task["title"],
-            "description": task["description"] if task["description"] else f"Implementation task: {task['title']}",
-            "issue_type": issue_type,
-            "priority": priority,
-            "project_key": project_key,
-            
-            # Assignment and ownership
-            "assignee": assignee,
-            "reporter": "kiro-ai-assistant",
-            
-            # Planning fields
-            "story_points": estimated_points,
-            "epic_link": epic_link,
-            "original_estimate": f"{estimated_points * 4}h",  # 4 hours per story point
-            "remaining_estimate": f"{estimated_points * 4}h",
-            
-            # Versioning
-            "fix_versions": fix_versions.split(",") if fix_versions else [],
-            "affects_versions": affects_versions.split(",") if affects_versions else [],
-            
-            # Components and labels
-            "components": components.split(",") if components else ["Development"],
-            "labels": labels,
-            
-            # Custom fields
-            "environment": "Development",
-            "due_date": (datetime.now() + timedelta(days=estimated_points * 2)).strftime("%Y-%m-%d"),
-            
-            # Kiro-specific fields
-            "requirements": task.get("requirements", []),
-            "subtasks": [st["title"] for st in task.get("subtasks", [])],
-            "acceptance_criteria": [
-                f"Complete implementation of {task['title']}",
-                "Code review passed",
-                "Unit tests written and passing",
-                "Documentation updated"
-            ],
-            
-            # Status and workflow
-            "status": "To Do",
-            "resolution": "",
-            
-            # Additional metadata
-            "created_by": "Kiro AI Assistant",
-            "creation_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "task_number": task.get("number", str(i))
-        }
-        
-        template_data.append(ticket_data)
-    
-    # Generate CSV format with comprehensive fields
+    # Every ticket in a batch shares one creation timestamp
+    now = datetime.now()
+    creation_date = now.strftime("%Y-%m-%d %H:%M:%S")
+    
+    # Estimates and due dates depend only on the story points, so each value is computed once
+    fixed_points = int(story_points) if story_points else 0
+    schedule_by_points = {}
+    
+    # Fields shared by every ticket
+    components_list = components.split(",") if components else ["Development"]
+    fix_versions_list = fix_versions.split(",") if fix_versions else []
+    affects_versions_list = affects_versions.split(",") if affects_versions else []
+    labels = KIRO_TICKET_LABELS if add_labels else ()
+    reporter = "kiro-ai-assistant"
+    environment = "Development"
+    status = "To Do"
+    created_by = "Kiro AI Assistant"
+    
+    # List settings shared by every ticket are joined once for the whole sheet
+    components_csv = "; ".join(components_list)
+    fix_versions_csv = "; ".join(fix_versions_list)
+    affects_versions_csv = "; ".join(affects_versions_list)
+    labels_csv = "; ".join(labels)
+    
+    # CSV format with comprehensive fields
     csv_buffer = StringIO()
     csv_writer = csv.writer(csv_buffer)
-    
-    # Comprehensive CSV headers
     csv_writer.writerow([
         "Summary", "Description", "Issue Type", "Priority", "Project Key", 
         "Assignee", "Reporter", "Story Points", "Epic Link", "Original Estimate",
@@ -725,188 +693,201 @@ def generate_jira_templates(parsed_tasks, issue_type, priority, project_key, add
         "Created By", "Creation Date", "Task Number"
     ])
     
-    # CSV data
-    for ticket in template_data:
-        csv_writer.writerow([
-            ticket["summary"],
-            ticket["description"],
-            ticket["issue_type"],
-            ticket["priority"],
-            ticket["project_key"],
-            ticket["assignee"],
-            ticket["reporter"],
-            ticket["story_points"],
-            ticket["epic_link"],
-            ticket["original_estimate"],
-            "; ".join(ticket["components"]),
-            "; ".join(ticket["fix_versions"]),
-            "; ".join(ticket["affects_versions"]),
-            "; ".join(ticket["labels"]),
-            ticket["environment"],
-            ticket["due_date"],
-            ticket["status"],
-            "; ".join(ticket["requirements"]),
-            "; ".join(ticket["subtasks"]),
-            "; ".join(ticket["acceptance_criteria"]),
-            ticket["created_by"],
-            ticket["creation_date"],
-            ticket["task_number"]
-        ])
-    
-    csv_content = csv_buffer.getvalue()
-    
-    # Generate JSON format (JIRA API ready) with comprehensive fields
+    # JSON format (JIRA API ready); nested values that are the same for
+    # every ticket are built once and shared, as serialization only reads them
     json_tickets = []
-    for ticket in template_data:
-        json_ticket = {
-            "fields": {
-                "project": {"key": ticket["project_key"]},
-                "summary": ticket["summary"],
-                "description": ticket["description"],
-                "issuetype": {"name": ticket["issue_type"]},
-                "priority": {"name": ticket["priority"]},
-                "reporter": {"name": ticket["reporter"]},
-                "environment": ticket["environment"],
-                "duedate": ticket["due_date"]
-            }
+    project_ref = {"key": project_key}
+    issue_type_ref = {"name": issue_type}
+    priority_ref = {"name": priority}
+    reporter_ref = {"name": reporter}
+    assignee_ref = {"name": assignee} if assignee else None
+    components_json = [{"name": comp.strip()} for comp in components_list]
+    fix_versions_json = [{"name": ver.strip()} for ver in fix_versions_list]
+    affects_versions_json = [{"name": ver.strip()} for ver in affects_versions_list]
+    
+    # Comprehensive Markdown format
+    md_parts = ["# JIRA Ticket Templates\n\n"]
+    md_parts.append(f"**Project:** {project_key}\n")
+    md_parts.append(f"**Issue Type:** {issue_type}\n")
+    md_parts.append(f"**Priority:** {priority}\n")
+    md_parts.append(f"**Generated:** {creation_date}\n\n")
+    
+    # Tasks.md format (Kiro-style)
+    tasks_md_parts = ["# Implementation Tasks (JIRA Export)\n\n"]
+    tasks_md_parts.append(f"Generated from Kiro on {creation_date}\n\n")
+    
+    # Each ticket is built once and written straight to all four outputs
+    for i, task in enumerate(parsed_tasks, 1):
+        title = task["title"]
+        subtasks = task.get("subtasks", ())
+        
+        # Estimate story points based on task complexity
+        estimated_points = fixed_points or len(subtasks) + 2
+        if estimated_points not in schedule_by_points:
+            schedule_by_points[estimated_points] = (
+                f"{estimated_points * 4}h",  # 4 hours per story point
+                (now + timedelta(days=estimated_points * 2)).strftime("%Y-%m-%d")
+            )
+        estimate, due_date = schedule_by_points[estimated_points]
+        
+        description = task["description"] or f"Implementation task: {title}"
+        requirements = task.get("requirements", ())
+        subtask_titles = [subtask["title"] for subtask in subtasks]
+        acceptance_criteria = (f"Complete implementation of {title}",) + STANDARD_ACCEPTANCE_CRITERIA
+        task_number = task.get("number", str(i))
+        
+        # CSV row
+        csv_writer.writerow((
+            title,
+            description,
+            issue_type,
+            priority,
+            project_key,
+            assignee,
+            reporter,
+            estimated_points,
+            epic_link,
+            estimate,
+            components_csv,
+            fix_versions_csv,
+            affects_versions_csv,
+            labels_csv,
+            environment,
+            due_date,
+            status,
+            "; ".join(requirements),
+            "; ".join(subtask_titles),
+            "; ".join(acceptance_criteria),
+            created_by,
+            creation_date,
+            task_number
+        ))
+        
+        # JSON ticket
+        fields = {
+            "project": project_ref,
+            "summary": title,
+            "description": description,
+            "issuetype": issue_type_ref,
+            "priority": priority_ref,
+            "reporter": reporter_ref,
+            "environment": environment,
+            "duedate": due_date
         }
         
         # Add optional fields if they exist
-        if ticket["assignee"]:
-            json_ticket["fields"]["assignee"] = {"name": ticket["assignee"]}
+        if assignee_ref:
+            fields["assignee"] = assignee_ref
         
-        if ticket["story_points"]:
-            json_ticket["fields"]["customfield_10016"] = ticket["story_points"]  # Common story points field
+        if estimated_points:
+            fields["customfield_10016"] = estimated_points  # Common story points field
         
-        if ticket["epic_link"]:
-            json_ticket["fields"]["customfield_10014"] = ticket["epic_link"]  # Common epic link field
+        if epic_link:
+            fields["customfield_10014"] = epic_link  # Common epic link field
         
-        if ticket["original_estimate"]:
-            json_ticket["fields"]["timetracking"] = {
-                "originalEstimate": ticket["original_estimate"],
-                "remainingEstimate": ticket["remaining_estimate"]
+        if estimate:
+            fields["timetracking"] = {
+                "originalEstimate": estimate,
+                "remainingEstimate": estimate
             }
         
-        if ticket["components"]:
-            json_ticket["fields"]["components"] = [{"name": comp.strip()} for comp in ticket["components"]]
+        if components_json:
+            fields["components"] = components_json
         
-        if ticket["fix_versions"]:
-            json_ticket["fields"]["fixVersions"] = [{"name": ver.strip()} for ver in ticket["fix_versions"]]
+        if fix_versions_json:
+            fields["fixVersions"] = fix_versions_json
         
-        if ticket["affects_versions"]:
-            json_ticket["fields"]["versions"] = [{"name": ver.strip()} for ver in ticket["affects_versions"]]
+        if affects_versions_json:
+            fields["versions"] = affects_versions_json
         
-        if ticket["labels"]:
-            json_ticket["fields"]["labels"] = ticket["labels"]
+        if labels:
+            fields["labels"] = labels
         
-        json_tickets.append(json_ticket)
-    
-    json_content = json.dumps({"issues": json_tickets}, indent=2)
-    
-    # Generate comprehensive Markdown format
-    md_content = "# JIRA Ticket Templates\n\n"
-    md_content += f"**Project:** {project_key}\n"
-    md_content += f"**Issue Type:** {issue_type}\n"
-    md_content += f"**Priority:** {priority}\n"
-    md_content += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    
-    for i, ticket in enumerate(template_data, 1):
-        md_content += f"## Ticket {i}: {ticket['summary']}\n\n"
+        json_tickets.append({"fields": fields})
+        
+        # Markdown section
+        md_parts.append(f"## Ticket {i}: {title}\n\n")
         
         # Core information
-        md_content += f"**Summary:** {ticket['summary']}\n\n"
-        md_content += f"**Description:**\n{ticket['description']}\n\n"
+        md_parts.append(f"**Summary:** {title}\n\n")
+        md_parts.append(f"**Description:**\n{description}\n\n")
         
         # Planning information
-        md_content += f"**Issue Type:** {ticket['issue_type']}\n"
-        md_content += f"**Priority:** {ticket['priority']}\n"
-        md_content += f"**Story Points:** {ticket['story_points']}\n"
-        md_content += f"**Original Estimate:** {ticket['original_estimate']}\n"
-        md_content += f"**Due Date:** {ticket['due_date']}\n\n"
+        md_parts.append(f"**Issue Type:** {issue_type}\n")
+        md_parts.append(f"**Priority:** {priority}\n")
+        md_parts.append(f"**Story Points:** {estimated_points}\n")
+        md_parts.append(f"**Original Estimate:** {estimate}\n")
+        md_parts.append(f"**Due Date:** {due_date}\n\n")
         
         # Assignment
-        if ticket["assignee"]:
-            md_content += f"**Assignee:** {ticket['assignee']}\n"
-        md_content += f"**Reporter:** {ticket['reporter']}\n\n"
+        if assignee:
+            md_parts.append(f"**Assignee:** {assignee}\n")
+        md_parts.append(f"**Reporter:** {reporter}\n\n")
         
         # Components and versions
-        if ticket["components"]:
-            md_content += f"**Components:** {', '.join(ticket['components'])}\n"
-        if ticket["fix_versions"]:
-            md_content += f"**Fix Versions:** {', '.join(ticket['fix_versions'])}\n"
-        if ticket["affects_versions"]:
-            md_content += f"**Affects Versions:** {', '.join(ticket['affects_versions'])}\n"
+        if components_list:
+            md_parts.append(f"**Components:** {', '.join(components_list)}\n")
+        if fix_versions_list:
+            md_parts.append(f"**Fix Versions:** {', '.join(fix_versions_list)}\n")
+        if affects_versions_list:
+            md_parts.append(f"**Affects Versions:** {', '.join(affects_versions_list)}\n")
         
         # Kiro-specific information
-        if ticket["requirements"]:
-            md_content += f"**Requirements:** {', '.join(ticket['requirements'])}\n"
+        if requirements:
+            md_parts.append(f"**Requirements:** {', '.join(requirements)}\n")
         
-        if ticket["subtasks"]:
-            md_content += f"**Subtasks:**\n"
-            for subtask in ticket["subtasks"]:
-                md_content += f"- {subtask}\n"
-            md_content += "\n"
+        if subtask_titles:
+            md_parts.append(f"**Subtasks:**\n")
+            md_parts.extend(f"- {subtask}\n" for subtask in subtask_titles)
+            md_parts.append("\n")
         
         # Acceptance criteria
-        md_content += f"**Acceptance Criteria:**\n"
-        for criteria in ticket["acceptance_criteria"]:
-            md_content += f"- {criteria}\n"
-        md_content += "\n"
+        md_parts.append(f"**Acceptance Criteria:**\n")
+        md_parts.extend(f"- {criteria}\n" for criteria in acceptance_criteria)
+        md_parts.append("\n")
         
         # Labels and metadata
-        if ticket["labels"]:
-            md_content += f"**Labels:** {', '.join(ticket['labels'])}\n"
-        md_content += f"**Environment:** {ticket['environment']}\n"
-        md_content += f"**Status:** {ticket['status']}\n\n"
+        if labels:
+            md_parts.append(f"**Labels:** {', '.join(labels)}\n")
+        md_parts.append(f"**Environment:** {environment}\n")
+        md_parts.append(f"**Status:** {status}\n\n")
         
-        md_content += "---\n\n"
-    
-    # Generate Tasks.md format (Kiro-style)
-    tasks_md_content = "# Implementation Tasks (JIRA Export)\n\n"
-    tasks_md_content += f"Generated from Kiro on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    
-    for i, ticket in enumerate(template_data, 1):
-        # Main task checkbox
-        tasks_md_content += f"- [ ] {ticket['task_number']}. {ticket['summary']}\n"
+        md_parts.append("---\n\n")
+        
+        # Tasks.md main task checkbox
+        tasks_md_parts.append(f"- [ ] {task_number}. {title}\n")
         
         # Task details
-        tasks_md_content += f"  - **Priority:** {ticket['priority']}\n"
-        tasks_md_content += f"  - **Story Points:** {ticket['story_points']}\n"
-        tasks_md_content += f"  - **Estimate:** {ticket['original_estimate']}\n"
-        tasks_md_content += f"  - **Due Date:** {ticket['due_date']}\n"
+        tasks_md_parts.append(f"  - **Priority:** {priority}\n")
+        tasks_md_parts.append(f"  - **Story Points:** {estimated_points}\n")
+        tasks_md_parts.append(f"  - **Estimate:** {estimate}\n")
+        tasks_md_parts.append(f"  - **Due Date:** {due_date}\n")
         
-        if ticket["assignee"]:
-            tasks_md_content += f"  - **Assignee:** {ticket['assignee']}\n"
+        if assignee:
+            tasks_md_parts.append(f"  - **Assignee:** {assignee}\n")
         
         # Description
-        if ticket["description"]:
-            desc_lines = ticket["description"].split('\n')
-            for line in desc_lines:
-                if line.strip():
-                    tasks_md_content += f"  - {line.strip()}\n"
+        tasks_md_parts.extend(f"  - {line.strip()}\n" for line in description.split('\n') if line.strip())
         
         # Subtasks
-        if ticket["subtasks"]:
-            for j, subtask in enumerate(ticket["subtasks"], 1):
-                tasks_md_content += f"  - [ ] {ticket['task_number']}.{j} {subtask}\n"
+        tasks_md_parts.extend(f"  - [ ] {task_number}.{j} {subtask}\n" for j, subtask in enumerate(subtask_titles, 1))
         
         # Requirements reference
-        if ticket["requirements"]:
-            tasks_md_content += f"  - _Requirements: {', '.join(ticket['requirements'])}_\n"
+        if requirements:
+            tasks_md_parts.append(f"  - _Requirements: {', '.join(requirements)}_\n")
         
         # Acceptance criteria
-        tasks_md_content += f"  - **Acceptance Criteria:**\n"
-        for criteria in ticket["acceptance_criteria"]:
-            tasks_md_content += f"    - {criteria}\n"
+        tasks_md_parts.append(f"  - **Acceptance Criteria:**\n")
+        tasks_md_parts.extend(f"    - {criteria}\n" for criteria in acceptance_criteria)
         
-        tasks_md_content += "\n"
+        tasks_md_parts.append("\n")
     
     return {
-        "csv": csv_content,
-        "json": json_content,
-        "markdown": md_content,
-        "tasks_md": tasks_md_content,
-        "count": len(template_data)
+        "csv": csv_buffer.getvalue(),
+        "json": json_utils.dumps({"issues": json_tickets}, pretty=True),
+        "markdown": "".join(md_parts),
+        "tasks_md": "".join(tasks_md_parts),
+        "count": len(json_tickets)
     }
 
 def show_jira_integration():
@@ -303,10 +303,12 @@ Each task should be concrete enough that a developer can execute it without addi
         if requirements.count("### Requirement") < 3:
             validation_results["suggestions"].append("Consider adding more detailed requirements (found less than 3)")
         
-        if "edge case" not in requirements.lower():
+        # Lowercase once for the case-insensitive suggestion checks
+        lowered_requirements = requirements.lower()
+        if "edge case" not in lowered_requirements:
             validation_results["suggestions"].append("Consider adding edge case handling requirements")
         
-        if "error" not in requirements.lower():
+        if "error" not in lowered_requirements:
             validation_results["suggestions"].append("Consider adding error handling requirements")
         
         return validation_results
@@ -1,11 +1,87 @@
 """
 Diagram Generator for creating Mermaid diagrams from code analysis
 """
-import re
 import json
 from typing import Dict, List, Optional, Any
 from services.ai_service import AIService
 
+# RE2 guarantees linear-time matching, which bounds the cost of scanning
+# untrusted model output and uploaded code; fall back to the stdlib engine.
+try:
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+# Markdown code fences wrapped around model-generated Mermaid code
+_FENCE_RE = _re.compile(r'```(?:mermaid)?\n?')
+
+# File path keywords used to classify files, each compiled to one alternation
+_MODEL_PATH_RE = _re.compile(r'model|entity|schema|dto|domain|migration|table|database')
+_API_PATH_RE = _re.compile(r'api|controller|route|endpoint|handler|rest|graphql|service')
+_SERVICE_PATH_RE = _re.compile(r'service|business|logic|manager|processor')
+
+# Content keywords used to classify files, each compiled to one alternation
+_MODEL_KEYWORDS_RE = _re.compile(
+    r'(?i)class.*Model|Entity|Table|Column|ForeignKey|relationship|schema|migration|CREATE TABLE'
+)
+_API_KEYWORDS_RE = _re.compile(
+    r'(?i)@app.route|@api.route|def get_|def post_|def put_|def delete_|FastAPI|Flask|Express|router|endpoint'
+)
+_CLASS_DEFINITION_RE = _re.compile(r'(?i)class\s+\w+|interface\s+\w+|public class|private class')
+
+# Static Mermaid diagrams returned when AI generation fails
+_FALLBACK_ER_DIAGRAM = """erDiagram
+    ENTITY {
+        id int PK
+        name string
+        created_at datetime
+    }"""
+
+_FALLBACK_FLOW_DIAGRAM = """flowchart TD
+    A[Client Request] --> B[API Layer]
+    B --> C[Service Layer]
+    C --> D[Data Layer]
+    D --> E[Database]
+    C --> F[External APIs]
+    B --> G[Response]"""
+
+_FALLBACK_ARCHITECTURE_DIAGRAM = """graph TB
+    subgraph "Presentation Layer"
+        UI[User Interface]
+        API[API Endpoints]
+    end
+    
+    subgraph "Business Layer"
+        SVC[Services]
+        BL[Business Logic]
+    end
+    
+    subgraph "Data Layer"
+        DB[Database]
+        EXT[External APIs]
+    end
+    
+    UI --> API
+    API --> SVC
+    SVC --> BL
+    BL --> DB
+    BL --> EXT"""
+
+_FALLBACK_CLASS_DIAGRAM = """classDiagram
+    class BaseClass {
+        +id: int
+        +created_at: datetime
+        +save()
+        +delete()
+    }
+    
+    class DerivedClass {
+        +name: string
+        +process()
+    }
+    
+    BaseClass <|-- DerivedClass"""
+
 class DiagramGenerator:
     """Generate various types of diagrams from codebase analysis"""
     
@@ -152,14 +228,9 @@ Focus on:
     def _extract_model_files(self, codebase: Dict) -> Dict:
         """Extract files that likely contain data models"""
         model_files = {}
-        model_patterns = [
-            r'model', r'entity', r'schema', r'dto', r'domain',
-            r'migration', r'table', r'database'
-        ]
         
         for file_path, content in codebase.items():
-            file_lower = file_path.lower()
-            if any(pattern in file_lower for pattern in model_patterns):
+            if _MODEL_PATH_RE.search(file_path.lower()):
                 model_files[file_path] = content
             elif self._contains_model_keywords(content):
                 model_files[file_path] = content
@@ -169,14 +240,9 @@ Focus on:
     def _extract_api_files(self, codebase: Dict) -> Dict:
         """Extract files that contain API definitions"""
         api_files = {}
-        api_patterns = [
-            r'api', r'controller', r'route', r'endpoint', r'handler',
-            r'rest', r'graphql', r'service'
-        ]
         
         for file_path, content in codebase.items():
-            file_lower = file_path.lower()
-            if any(pattern in file_lower for pattern in api_patterns):
+            if _API_PATH_RE.search(file_path.lower()):
                 api_files[file_path] = content
             elif self._contains_api_keywords(content):
                 api_files[file_path] = content
@@ -186,13 +252,9 @@ Focus on:
     def _extract_service_files(self, codebase: Dict) -> Dict:
         """Extract service layer files"""
         service_files = {}
-        service_patterns = [
-            r'service', r'business', r'logic', r'manager', r'processor'
-        ]
         
         for file_path, content in codebase.items():
-            file_lower = file_path.lower()
-            if any(pattern in file_lower for pattern in service_patterns):
+            if _SERVICE_PATH_RE.search(file_path.lower()):
                 service_files[file_path] = content
         
         return service_files
@@ -209,57 +271,33 @@ Focus on:
     
     def _contains_model_keywords(self, content: str) -> bool:
         """Check if content contains model-related keywords"""
-        keywords = [
-            'class.*Model', 'Entity', 'Table', 'Column', 'ForeignKey',
-            'relationship', 'schema', 'migration', 'CREATE TABLE'
-        ]
-        return any(re.search(keyword, content, re.IGNORECASE) for keyword in keywords)
+        return _MODEL_KEYWORDS_RE.search(content) is not None
     
     def _contains_api_keywords(self, content: str) -> bool:
         """Check if content contains API-related keywords"""
-        keywords = [
-            '@app.route', '@api.route', 'def get_', 'def post_', 'def put_', 'def delete_',
-            'FastAPI', 'Flask', 'Express', 'router', 'endpoint'
-        ]
-        return any(re.search(keyword, content, re.IGNORECASE) for keyword in keywords)
+        return _API_KEYWORDS_RE.search(content) is not None
     
     def _contains_class_definitions(self, content: str) -> bool:
         """Check if content contains class definitions"""
-        patterns = [
-            r'class\s+\w+', r'interface\s+\w+', r'public class', r'private class'
-        ]
-        return any(re.search(pattern, content, re.IGNORECASE) for pattern in patterns)
+        return _CLASS_DEFINITION_RE.search(content) is not None
     
     def _clean_mermaid_code(self, raw_code: str, diagram_type: str) -> str:
         """Clean and validate Mermaid diagram code"""
         # Remove markdown code blocks if present
-        cleaned = re.sub(r'```mermaid\n?', '', raw_code)
-        cleaned = re.sub(r'```\n?', '', cleaned)
+        cleaned = _FENCE_RE.sub('', raw_code) if '```' in raw_code else raw_code
         
         # Ensure diagram starts with correct type
-        if not cleaned.strip().startswith(diagram_type):
+        if not cleaned.lstrip().startswith(diagram_type):
             cleaned = f"{diagram_type}\n{cleaned}"
         
-        # Basic validation and cleanup
-        lines = cleaned.split('\n')
-        valid_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#'):  # Remove comments
-                valid_lines.append(line)
-        
-        return '\n'.join(valid_lines)
+        # Basic validation and cleanup: drop blank lines and comments
+        stripped_lines = (line.strip() for line in cleaned.split('\n'))
+        return '\n'.join(line for line in stripped_lines if line and line[0] != '#')
     
     def _generate_fallback_er_diagram(self, model_files: Dict) -> str:
         """Generate a basic ER diagram when AI generation fails"""
         if not model_files:
-            return """erDiagram
-    ENTITY {
-        id int PK
-        name string
-        created_at datetime
-    }"""
+            return _FALLBACK_ER_DIAGRAM
         
         entities = []
         for file_path in model_files.keys():
@@ -275,51 +313,12 @@ Focus on:
     
     def _generate_fallback_flow_diagram(self, api_files: Dict, service_files: Dict) -> str:
         """Generate a basic flow diagram when AI generation fails"""
-        return """flowchart TD
-    A[Client Request] --> B[API Layer]
-    B --> C[Service Layer]
-    C --> D[Data Layer]
-    D --> E[Database]
-    C --> F[External APIs]
-    B --> G[Response]"""
+        return _FALLBACK_FLOW_DIAGRAM
     
     def _generate_fallback_architecture_diagram(self, codebase: Dict) -> str:
         """Generate a basic architecture diagram when AI generation fails"""
-        return """graph TB
-    subgraph "Presentation Layer"
-        UI[User Interface]
-        API[API Endpoints]
-    end
-    
-    subgraph "Business Layer"
-        SVC[Services]
-        BL[Business Logic]
-    end
-    
-    subgraph "Data Layer"
-        DB[Database]
-        EXT[External APIs]
-    end
-    
-    UI --> API
-    API --> SVC
-    SVC --> BL
-    BL --> DB
-    BL --> EXT"""
+        return _FALLBACK_ARCHITECTURE_DIAGRAM
     
     def _generate_fallback_class_diagram(self, class_files: Dict) -> str:
         """Generate a basic class diagram when AI generation fails"""
-        return """classDiagram
-    class BaseClass {
-        +id: int
-        +created_at: datetime
-        +save()
-        +delete()
-    }
-    
-    class DerivedClass {
-        +name: string
-        +process()
-    }
-    
-    BaseClass <|-- DerivedClass"""
\ No newline at end of file
+        return _FALLBACK_CLASS_DIAGRAM
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 JIRA Integration Client for creating and managing tickets
 """
+import re
 import requests
 import json
 import base64
@@ -8,6 +9,17 @@ from typing import Dict, List, Optional, Any
 import streamlit as st
 from datetime import datetime
 
+# One pass over the markdown: task/sub-task checkboxes, or 4-space indented detail lines.
+# Trailing \r is excluded so CRLF documents parse like LF ones.
+TASK_LINE_RE = re.compile(
+    r'^[ \t]*- \[ \] (?P<num>\d+(?:\.\d+)*)\.? (?P<title>.+?)[ \t\r]*$'
+    r'|^ {4}- (?:_Requirements:\s*(?P<reqs>[^_]+)_|(?P<desc>.+?))[ \t\r]*$',
+    re.MULTILINE
+)
+
+# JIRA Cloud accepts at most 50 issues per bulk create request
+JIRA_BULK_CREATE_LIMIT = 50
+
 class JiraClient:
     """JIRA API client for ticket management"""
     
@@ -116,34 +128,16 @@ class JiraClient:
             
             # Prepare ticket data
             ticket_data = {
-                "fields": {
-                    "project": {"key": self.project_key},
-                    "summary": summary,
-                    "description": description,
-                    "issuetype": {"name": issue_type}
-                }
+                "fields": self._ticket_fields(summary, description, issue_type, priority, labels)
             }
             
-            # Add priority if specified
-            if priority:
-                ticket_data["fields"]["priority"] = {"name": priority}
-            
-            # Add labels if specified
-            if labels:
-                ticket_data["fields"]["labels"] = labels
-            
             response = self.session.post(
                 f"{self.base_url}/rest/api/2/issue",
                 data=json.dumps(ticket_data)
             )
             
             if response.status_code == 201:
-                ticket = response.json()
-                return {
-                    "key": ticket["key"],
-                    "id": ticket["id"],
-                    "url": f"{self.base_url}/browse/{ticket['key']}"
-                }
+                return self._ticket_reference(response.json())
             else:
                 error_msg = response.text
                 try:
@@ -159,6 +153,88 @@ class JiraClient:
             st.error(f"Error creating ticket: {e}")
             return None
     
+    def create_tickets_bulk(self, tickets: List[Dict]) -> List[Optional[Dict]]:
+        """Create several JIRA tickets with one bulk request per batch
+        
+        Each item holds create_ticket's keyword arguments. The result lines up
+        with the input, holding None for every ticket JIRA rejected.
+        """
+        results = [None] * len(tickets)
+        
+        if not all([self.base_url, self.project_key]):
+            st.error("JIRA not properly configured")
+            return results
+        
+        for start in range(0, len(tickets), JIRA_BULK_CREATE_LIMIT):
+            batch = tickets[start:start + JIRA_BULK_CREATE_LIMIT]
+            
+            try:
+                bulk_data = {
+                    "issueUpdates": [{"fields": self._ticket_fields(**ticket)} for ticket in batch]
+                }
+                
+                response = self.session.post(
+                    f"{self.base_url}/rest/api/2/issue/bulk",
+                    data=json.dumps(bulk_data)
+                )
+                
+                # JIRA answers 201 when any issue was created and 400 when none
+                # were; both carry the created issues and per-element errors
+                if response.status_code not in (201, 400):
+                    st.error(f"Failed to create tickets: {response.status_code} - {response.text}")
+                    continue
+                
+                bulk_result = response.json()
+                failed = set()
+                for error in bulk_result.get("errors", []):
+                    failed.add(error.get("failedElementNumber"))
+                    element_errors = error.get("elementErrors", {})
+                    messages = element_errors.get("errorMessages", []) + [
+                        f"{k}: {v}" for k, v in element_errors.get("errors", {}).items()
+                    ]
+                    st.error(f"Failed to create ticket: {error.get('status')} - {'; '.join(messages)}")
+                
+                # Created issues come back in request order, skipping failures
+                created = iter(bulk_result.get("issues", []))
+                for offset in range(len(batch)):
+                    if offset not in failed:
+                        issue = next(created, None)
+                        if issue:
+                            results[start + offset] = self._ticket_reference(issue)
+                
+            except Exception as e:
+                st.error(f"Error creating tickets: {e}")
+        
+        return results
+    
+    def _ticket_fields(self, summary: str, description: str, issue_type: str = "Task",
+                       priority: str = "Medium", labels: List[str] = None) -> Dict:
+        """Build the JIRA fields for one ticket in the configured project"""
+        fields = {
+            "project": {"key": self.project_key},
+            "summary": summary,
+            "description": description,
+            "issuetype": {"name": issue_type}
+        }
+        
+        # Add priority if specified
+        if priority:
+            fields["priority"] = {"name": priority}
+        
+        # Add labels if specified
+        if labels:
+            fields["labels"] = labels
+        
+        return fields
+    
+    def _ticket_reference(self, issue: Dict) -> Dict:
+        """Summarize a created issue as key, id and browse URL"""
+        return {
+            "key": issue["key"],
+            "id": issue["id"],
+            "url": f"{self.base_url}/browse/{issue['key']}"
+        }
+    
     def create_tickets_from_tasks(self, tasks_markdown: str, issue_type: str = "Task") -> List[Dict]:
         """Create JIRA tickets from Kiro tasks markdown"""
         try:
@@ -167,16 +243,19 @@ class JiraClient:
             # Parse tasks from markdown
             tasks = self.parse_tasks_from_markdown(tasks_markdown)
             
-            for task in tasks:
-                # Create ticket for each main task
-                ticket = self.create_ticket(
-                    summary=task["title"],
-                    description=task["description"],
-                    issue_type=issue_type,
-                    priority=task.get("priority", "Medium"),
-                    labels=["kiro-generated", "implementation"]
-                )
-                
+            # Create a ticket for each main task, batched into bulk requests
+            tickets = self.create_tickets_bulk([
+                {
+                    "summary": task["title"],
+                    "description": task["description"],
+                    "issue_type": issue_type,
+                    "priority": task.get("priority", "Medium"),
+                    "labels": ["kiro-generated", "implementation"]
+                }
+                for task in tasks
+            ])
+            
+            for task, ticket in zip(tasks, tickets):
                 if ticket:
                     tickets_created.append({
                         "task": task["title"],
@@ -193,58 +272,44 @@ class JiraClient:
         """Parse tasks from Kiro markdown format"""
         tasks = []
         current_task = None
+        description_parts = []
         
-        lines = markdown.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Main task (- [ ] 1. Task title)
-            if line.startswith('- [ ]') and '. ' in line:
-                if current_task:
-                    tasks.append(current_task)
-                
-                # Extract task number and title
-                parts = line.split('. ', 1)
-                if len(parts) == 2:
-                    task_num = parts[0].replace('- [ ]', '').strip()
-                    title = parts[1].strip()
+        for match in TASK_LINE_RE.finditer(markdown):
+            if match.group('num'):
+                # Main task (- [ ] 1. Task title); the number depth, not the indent, sets the level
+                if '.' not in match.group('num'):
+                    if current_task:
+                        current_task["description"] = "\n".join(description_parts)
+                        tasks.append(current_task)
+                        description_parts = []
                     
                     current_task = {
-                        "number": task_num,
-                        "title": title,
+                        "number": match.group('num'),
+                        "title": match.group('title'),
                         "description": "",
                         "subtasks": [],
                         "requirements": [],
                         "priority": "Medium"
                     }
-            
-            # Sub-task (  - [ ] 1.1 Sub-task title)
-            elif line.startswith('  - [ ]') and current_task:
-                parts = line.split('. ', 1)
-                if len(parts) == 2:
-                    subtask_num = parts[0].replace('- [ ]', '').strip()
-                    subtask_title = parts[1].strip()
+                
+                # Sub-task (  - [ ] 1.1 Sub-task title)
+                elif current_task:
                     current_task["subtasks"].append({
-                        "number": subtask_num,
-                        "title": subtask_title
+                        "number": match.group('num'),
+                        "title": match.group('title')
                     })
             
-            # Description lines (start with - but not checkbox)
-            elif line.startswith('    -') and current_task:
-                desc_line = line.replace('    -', '').strip()
-                if desc_line.startswith('_Requirements:'):
-                    # Extract requirements
-                    req_text = desc_line.replace('_Requirements:', '').replace('_', '').strip()
-                    current_task["requirements"] = [r.strip() for r in req_text.split(',')]
+            elif current_task:
+                if match.group('reqs'):
+                    # Extract requirements (    - _Requirements: 1.1, 8.1_)
+                    current_task["requirements"] = [r.strip() for r in match.group('reqs').split(',')]
                 else:
-                    # Add to description
-                    if current_task["description"]:
-                        current_task["description"] += "\n"
-                    current_task["description"] += f"• {desc_line}"
+                    # Add to description (joined once when the task is complete)
+                    description_parts.append(f"• {match.group('desc')}")
         
         # Add the last task
         if current_task:
+            current_task["description"] = "\n".join(description_parts)
             tasks.append(current_task)
         
         return tasks
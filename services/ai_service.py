@@ -1,9 +1,14 @@
 import boto3
 import json
 import logging
+import sqlite3
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 from botocore.exceptions import ClientError, NoCredentialsError
 import streamlit as st
+from utils.response_cache import ResponseCache
+from utils import json_utils
+from services.file_service import EXTENSION_LANGUAGES
 
 class AIService:
     """AI Service for AWS Bedrock integration with Claude and Nova models"""
@@ -21,9 +26,11 @@ class AIService:
             "Amazon Nova Pro": {
                 "model_id": "amazon.nova-pro-v1:0",
                 "max_tokens": 4096,
-                "temperature": 0.7
+                "temperature": 0.7,
+                "prompt_caching": True
             }
         }
+        self.response_cache = ResponseCache()
         self.logger = logging.getLogger(__name__)
         
     def initialize_bedrock_client(self) -> bool:
@@ -69,7 +76,7 @@ class AIService:
                 self.logger.info("Successfully connected to AWS Bedrock")
                 
                 # Verify our target models are available
-                available_models = [model['modelId'] for model in response.get('modelSummaries', [])]
+                available_models = {model['modelId'] for model in response.get('modelSummaries', [])}
                 
                 # Check if our configured models are available
                 for model_name, config in self.model_configs.items():
@@ -98,7 +105,7 @@ class AIService:
         
         try:
             response = self.bedrock_control_client.list_foundation_models()
-            available_models = [model['modelId'] for model in response.get('modelSummaries', [])]
+            available_models = {model['modelId'] for model in response.get('modelSummaries', [])}
             
             # Filter to only our configured models that are available
             configured_available = []
@@ -161,6 +168,10 @@ class AIService:
         if system_prompt:
             payload["system"] = [{"text": system_prompt}]
             
+            # Let Bedrock reuse the shared system prompt prefix across calls
+            if config.get("prompt_caching"):
+                payload["system"].append({"cachePoint": {"type": "default"}})
+            
         return payload
     
     def _invoke_model(self, payload: Dict) -> str:
@@ -170,11 +181,11 @@ class AIService:
             
             response = self.bedrock_client.invoke_model(
                 modelId=config["model_id"],
-                body=json.dumps(payload),
+                body=json_utils.dumps_bytes(payload),
                 contentType="application/json"
             )
             
-            response_body = json.loads(response['body'].read())
+            response_body = json_utils.loads(response['body'].read())
             
             # Parse response based on model type
             if "claude" in config["model_id"].lower():
@@ -200,6 +211,22 @@ class AIService:
         if not self.current_model:
             raise Exception("No model selected. Please select a model first.")
         
+        # Identical requests can be served from the response cache (KIRO_CACHE_MODE)
+        cache_key = None
+        if self.response_cache.active:
+            config = self.model_configs[self.current_model]
+            cache_key = ResponseCache.make_key(
+                config["model_id"], config["temperature"], config["max_tokens"], prompt, system_prompt
+            )
+            try:
+                cached_response = self.response_cache.get(cache_key)
+            except (sqlite3.Error, OSError) as e:
+                # A broken cache must not stop generation; fall through to the model
+                self.logger.warning(f"Response cache lookup failed: {e}")
+                cached_response = None
+            if cached_response is not None:
+                return cached_response
+        
         if not self.bedrock_client:
             if not self.initialize_bedrock_client():
                 raise Exception("Failed to initialize Bedrock client")
@@ -213,11 +240,18 @@ class AIService:
             else:
                 raise Exception(f"Unsupported model: {self.current_model}")
             
-            return self._invoke_model(payload)
+            response = self._invoke_model(payload)
             
         except Exception as e:
             self.logger.error(f"Text generation failed: {e}")
             raise e
+        
+        if cache_key:
+            try:
+                self.response_cache.put(cache_key, response)
+            except (sqlite3.Error, OSError) as e:
+                self.logger.warning(f"Response cache store failed: {e}")
+        return response
     
     def generate_requirements(self, description: str, context: Dict = None) -> str:
         """Generate EARS-format requirements from description"""
@@ -297,19 +331,6 @@ class AIService:
     
     def _detect_languages(self, files: Dict) -> List[str]:
         """Detect programming languages from file extensions"""
-        extensions = set()
-        for file_path in files.keys():
-            if '.' in file_path:
-                ext = file_path.split('.')[-1].lower()
-                extensions.add(ext)
-        
-        # Map extensions to languages
-        lang_map = {
-            'py': 'Python', 'js': 'JavaScript', 'ts': 'TypeScript',
-            'java': 'Java', 'cpp': 'C++', 'c': 'C', 'cs': 'C#',
-            'go': 'Go', 'rs': 'Rust', 'php': 'PHP', 'rb': 'Ruby',
-            'html': 'HTML', 'css': 'CSS', 'sql': 'SQL', 'json': 'JSON',
-            'yaml': 'YAML', 'yml': 'YAML', 'xml': 'XML', 'md': 'Markdown'
-        }
+        extensions = {Path(file_path).suffix.lower() for file_path in files}
         
-        return [lang_map.get(ext, ext.upper()) for ext in extensions if ext in lang_map]
\ No newline at end of file
+        return [EXTENSION_LANGUAGES[ext] for ext in extensions if ext in EXTENSION_LANGUAGES]
\ No newline at end of file
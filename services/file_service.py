@@ -4,6 +4,28 @@ from pathlib import Path
 from typing import Dict, List, Tuple
 import mimetypes
 import logging
+from itertools import islice
+
+# Common development directories offered as quick project locations
+COMMON_PROJECT_ROOTS = (
+    '/home/ec2-user/projects',
+    '/home/ubuntu/projects',
+    '/opt/projects',
+    '/var/www',
+    '/app',
+    '/workspace'
+)
+
+# Map extensions to languages
+EXTENSION_LANGUAGES = {
+    '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
+    '.java': 'Java', '.cpp': 'C++', '.c': 'C', '.cs': 'C#',
+    '.go': 'Go', '.rs': 'Rust', '.php': 'PHP', '.rb': 'Ruby',
+    '.html': 'HTML', '.css': 'CSS', '.scss': 'SCSS', '.sass': 'Sass',
+    '.sql': 'SQL', '.json': 'JSON', '.yaml': 'YAML', '.yml': 'YAML',
+    '.xml': 'XML', '.md': 'Markdown', '.sh': 'Shell', '.bat': 'Batch',
+    '.dockerfile': 'Docker', '.tf': 'Terraform'
+}
 
 class FileService:
     """Service for handling file and folder operations"""
@@ -77,7 +99,8 @@ class FileService:
             
             # Check if we can read the directory
             try:
-                list(path.iterdir())
+                with os.scandir(path):
+                    pass
             except PermissionError:
                 st.error(f"❌ Permission denied: Cannot read folder {folder_path}")
                 return False
@@ -115,23 +138,19 @@ class FileService:
         common_paths = []
         
         # Check common development directories
-        potential_paths = [
-            '/home/ec2-user/projects',
-            '/home/ubuntu/projects',
-            '/opt/projects',
-            '/var/www',
-            '/app',
-            '/workspace'
-        ]
-        
-        for path in potential_paths:
-            if Path(path).exists() and Path(path).is_dir():
-                try:
-                    # List subdirectories
-                    subdirs = [str(p) for p in Path(path).iterdir() if p.is_dir()]
-                    common_paths.extend(subdirs[:10])  # Limit to 10 per directory
-                except PermissionError:
-                    continue
+        for path in COMMON_PROJECT_ROOTS:
+            try:
+                # List subdirectories; DirEntry caches the file type, avoiding a stat per entry.
+                # Opening the directory directly doubles as the existence check.
+                # Stop reading each directory once its first 10 subdirectories are found.
+                with os.scandir(path) as entries:
+                    subdirs = islice((entry.path for entry in entries if entry.is_dir()), 10)
+                    common_paths.extend(subdirs)  # Limit to 10 per directory
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                continue
+            
+            if len(common_paths) >= 20:
+                break
         
         return common_paths[:20]  # Limit total results
     
@@ -173,25 +192,40 @@ class FileService:
             progress_bar = st.progress(0)
             status_text = st.empty()
             
-            # Get all files first for progress calculation
-            all_files = list(folder.rglob('*'))
-            text_files = [f for f in all_files if f.is_file() and self.is_text_file(f)]
+            # Get all files first for progress calculation; scandir entries
+            # carry the file type and inode from the directory read itself
+            text_entries = []
+            pending_dirs = [str(folder)]
+            while pending_dirs:
+                try:
+                    with os.scandir(pending_dirs.pop()) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending_dirs.append(entry.path)
+                            elif entry.is_file() and self.is_text_file(Path(entry.path)):
+                                text_entries.append(entry)
+                except OSError as e:
+                    self.logger.warning(f"Skipping unreadable directory: {e}")
+            
+            if len(text_entries) > self.max_total_files:
+                st.warning(f"⚠️ Found {len(text_entries)} files. Processing first {self.max_total_files} files.")
+                text_entries = text_entries[:self.max_total_files]
             
-            if len(text_files) > self.max_total_files:
-                st.warning(f"⚠️ Found {len(text_files)} files. Processing first {self.max_total_files} files.")
-                text_files = text_files[:self.max_total_files]
+            # Read in inode order, which tracks on-disk layout and cuts seeks
+            text_entries.sort(key=lambda entry: entry.inode())
             
-            total_files = len(text_files)
+            total_files = len(text_entries)
             
-            for i, file_path in enumerate(text_files):
+            for i, entry in enumerate(text_entries):
+                file_path = Path(entry.path)
                 try:
                     # Update progress
                     progress = (i + 1) / total_files
                     progress_bar.progress(progress)
                     status_text.text(f"Reading file {i + 1}/{total_files}: {file_path.name}")
                     
-                    # Check file size
-                    if file_path.stat().st_size > self.max_file_size:
+                    # Check file size; the entry caches its stat result
+                    if entry.stat().st_size > self.max_file_size:
                         self.logger.warning(f"Skipping large file: {file_path}")
                         continue
                     
@@ -279,20 +313,22 @@ class FileService:
                 "file_types": {}
             }
         
-        total_size = sum(len(content) for content in files.values())
-        
-        # Analyze file types
+        # Total size, file types and largest file in one pass over the files
+        total_size = 0
         file_types = {}
-        for file_path in files.keys():
+        largest_file = None
+        largest_size = -1
+        for file_path, content in files.items():
+            size = len(content)
+            total_size += size
+            if size > largest_size:
+                largest_file, largest_size = file_path, size
             if '.' in file_path:
                 ext = Path(file_path).suffix.lower()
                 file_types[ext] = file_types.get(ext, 0) + 1
         
-        # Find largest file
-        largest_file = max(files.items(), key=lambda x: len(x[1]))
-        
-        # Detect languages
-        languages = self.detect_languages(files)
+        # Detect languages from the extensions already counted above
+        languages = sorted(EXTENSION_LANGUAGES[ext] for ext in file_types if ext in EXTENSION_LANGUAGES)
         
         return {
             "total_files": len(files),
@@ -300,8 +336,8 @@ class FileService:
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "languages": languages,
             "largest_file": {
-                "path": largest_file[0],
-                "size": len(largest_file[1])
+                "path": largest_file,
+                "size": largest_size
             },
             "file_types": file_types
         }
@@ -314,20 +350,9 @@ class FileService:
                 ext = Path(file_path).suffix.lower()
                 extensions.add(ext)
         
-        # Map extensions to languages
-        lang_map = {
-            '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
-            '.java': 'Java', '.cpp': 'C++', '.c': 'C', '.cs': 'C#',
-            '.go': 'Go', '.rs': 'Rust', '.php': 'PHP', '.rb': 'Ruby',
-            '.html': 'HTML', '.css': 'CSS', '.scss': 'SCSS', '.sass': 'Sass',
-            '.sql': 'SQL', '.json': 'JSON', '.yaml': 'YAML', '.yml': 'YAML',
-            '.xml': 'XML', '.md': 'Markdown', '.sh': 'Shell', '.bat': 'Batch',
-            '.dockerfile': 'Docker', '.tf': 'Terraform'
-        }
-        
         detected_languages = []
         for ext in extensions:
-            if ext in lang_map:
-                detected_languages.append(lang_map[ext])
+            if ext in EXTENSION_LANGUAGES:
+                detected_languages.append(EXTENSION_LANGUAGES[ext])
         
         return sorted(detected_languages)
\ No newline at end of file
@@ -6,51 +6,126 @@ Run this script to test if your AWS credentials and permissions are working corr
 
 import boto3
 import json
+import os
+import sys
+import time
+from functools import wraps
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from tests._runner import skip_unless_live
+
+# Successful probe results are cached here so repeated runs skip the network round-trips
+PROBE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "kiro", "bedrock_probe.json")
+
+def _cached_probe(ttl_seconds: int = 3600):
+    """Reuse a successful probe result for ttl_seconds (pass --force to re-run)"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if "--force" not in sys.argv:
+                try:
+                    with open(PROBE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                        cached = json.load(f)
+                    if time.time() - cached["timestamp"] < ttl_seconds:
+                        out = [
+                            "🔍 Using cached AWS Bedrock probe result (run with --force to re-test)",
+                            f"   ✅ AWS Identity: {cached['identity_arn']}"
+                        ]
+                        out.extend(
+                            f"   {'✅' if status == 'available' else '⚠️ '} {model_id}: {status}"
+                            for model_id, status in cached["target_models"].items()
+                        )
+                        sys.stdout.write("\n".join(out) + "\n")
+                        return cached
+                except (OSError, ValueError, KeyError):
+                    pass
+            
+            result = func(*args, **kwargs)
+            
+            if result:
+                result["timestamp"] = time.time()
+                try:
+                    os.makedirs(os.path.dirname(PROBE_CACHE_FILE), exist_ok=True)
+                    tmp_file = f"{PROBE_CACHE_FILE}.tmp"
+                    with open(tmp_file, 'w', encoding='utf-8') as f:
+                        json.dump(result, f)
+                    os.replace(tmp_file, PROBE_CACHE_FILE)
+                except OSError as e:
+                    print(f"⚠️  Could not cache probe result: {e}")
+            
+            return result
+        return wrapper
+    return decorator
+
 def test_bedrock_connection():
     """Test AWS Bedrock connection and permissions"""
-    print("🔍 Testing AWS Bedrock Connection...")
-    print("=" * 50)
+    skip_unless_live()
+    
+    # Always probe afresh under pytest; the on-disk cache is for the script only
+    assert _run_probe() is not None, "AWS Bedrock connection checks failed"
+
+def _run_probe():
+    """Run the Bedrock checks and print the report
+    
+    Returns the probe results when every check succeeded, otherwise None.
+    """
+    # Collect the report and write it in one call instead of one write per line
+    out = []
+    try:
+        return _probe_bedrock(out)
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
+
+# Script entry point: reuses a successful probe for an hour
+probe_bedrock_connection = _cached_probe(ttl_seconds=3600)(_run_probe)
+
+def _probe_bedrock(out: list):
+    """Run the Bedrock checks, appending report lines to out"""
+    out.append("🔍 Testing AWS Bedrock Connection...")
+    out.append("=" * 50)
     
     try:
         # Test AWS credentials
-        print("1. Testing AWS credentials...")
+        out.append("1. Testing AWS credentials...")
         session = boto3.Session()
         sts = session.client('sts')
         identity = sts.get_caller_identity()
-        print(f"   ✅ AWS Identity: {identity.get('Arn', 'Unknown')}")
+        out.append(f"   ✅ AWS Identity: {identity.get('Arn', 'Unknown')}")
+        
+        probe = {"identity_arn": identity.get('Arn', 'Unknown'), "target_models": {}}
+        success = True
         
         # Test Bedrock control plane access
-        print("\n2. Testing Bedrock control plane access...")
+        out.append("\n2. Testing Bedrock control plane access...")
         bedrock_control = session.client('bedrock', region_name='us-east-1')
         
-        try:
-            models_response = bedrock_control.list_foundation_models()
-            available_models = [model['modelId'] for model in models_response.get('modelSummaries', [])]
-            print(f"   ✅ Found {len(available_models)} available models")
-            
-            # Check for our target models
-            target_models = [
-                'anthropic.claude-3-5-sonnet-20241022-v2:0',
-                'amazon.nova-pro-v1:0'
-            ]
-            
-            for model_id in target_models:
-                if model_id in available_models:
-                    print(f"   ✅ Target model available: {model_id}")
+        # Check for our target models
+        target_models = [
+            'anthropic.claude-3-5-sonnet-20241022-v2:0',
+            'amazon.nova-pro-v1:0'
+        ]
+        
+        # Query each target model directly instead of downloading the full catalog
+        for model_id in target_models:
+            try:
+                bedrock_control.get_foundation_model(modelIdentifier=model_id)
+                out.append(f"   ✅ Target model available: {model_id}")
+                probe["target_models"][model_id] = "available"
+            except ClientError as e:
+                error_code = e.response['Error']['Code']
+                if error_code == 'ResourceNotFoundException':
+                    out.append(f"   ⚠️  Target model not found: {model_id}")
+                    probe["target_models"][model_id] = "not found"
+                elif error_code == 'AccessDeniedException':
+                    out.append(f"   ⚠️  Access denied to get model {model_id} (this is OK if you have invoke permissions)")
+                    probe["target_models"][model_id] = "access denied"
                 else:
-                    print(f"   ⚠️  Target model not found: {model_id}")
-                    
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            if error_code == 'AccessDeniedException':
-                print("   ⚠️  Access denied to list models (this is OK if you have invoke permissions)")
-            else:
-                print(f"   ❌ Error listing models: {e}")
+                    out.append(f"   ❌ Error checking model {model_id}: {e}")
+                    success = False
         
         # Test Bedrock runtime access
-        print("\n3. Testing Bedrock runtime access...")
+        out.append("\n3. Testing Bedrock runtime access...")
         bedrock_runtime = session.client('bedrock-runtime', region_name='us-east-1')
         
         # Try a simple test with Claude (if available)
@@ -68,33 +143,36 @@ def test_bedrock_connection():
             )
             
             response_body = json.loads(response['body'].read())
-            print("   ✅ Successfully invoked Claude model")
-            print(f"   📝 Test response: {response_body.get('content', [{}])[0].get('text', 'No text')[:50]}...")
+            out.append("   ✅ Successfully invoked Claude model")
+            out.append(f"   📝 Test response: {response_body.get('content', [{}])[0].get('text', 'No text')[:50]}...")
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code == 'AccessDeniedException':
-                print("   ❌ Access denied to invoke Claude model")
-                print("   💡 Check your IAM permissions for bedrock-runtime:InvokeModel")
+                out.append("   ❌ Access denied to invoke Claude model")
+                out.append("   💡 Check your IAM permissions for bedrock-runtime:InvokeModel")
             elif error_code == 'ValidationException':
-                print("   ❌ Model validation error (model might not be available in your region)")
+                out.append("   ❌ Model validation error (model might not be available in your region)")
             else:
-                print(f"   ❌ Error invoking model: {e}")
+                out.append(f"   ❌ Error invoking model: {e}")
+            success = False
+        
+        out.append("\n" + "=" * 50)
+        out.append("✅ Connection test completed!")
+        out.append("\n💡 If you see errors above, check:")
+        out.append("   - Your EC2 instance has an IAM role attached")
+        out.append("   - The IAM role has the necessary Bedrock permissions")
+        out.append("   - Bedrock is available in your region (us-east-1)")
+        out.append("   - You have access to the specific models you want to use")
         
-        print("\n" + "=" * 50)
-        print("✅ Connection test completed!")
-        print("\n💡 If you see errors above, check:")
-        print("   - Your EC2 instance has an IAM role attached")
-        print("   - The IAM role has the necessary Bedrock permissions")
-        print("   - Bedrock is available in your region (us-east-1)")
-        print("   - You have access to the specific models you want to use")
+        return probe if success else None
         
     except NoCredentialsError:
-        print("❌ No AWS credentials found!")
-        print("💡 Make sure your EC2 instance has an IAM role attached with Bedrock permissions")
+        out.append("❌ No AWS credentials found!")
+        out.append("💡 Make sure your EC2 instance has an IAM role attached with Bedrock permissions")
         
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        out.append(f"❌ Unexpected error: {e}")
 
 if __name__ == "__main__":
-    test_bedrock_connection()
\ No newline at end of file
+    probe_bedrock_connection()
\ No newline at end of file
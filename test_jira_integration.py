@@ -5,9 +5,12 @@ Test script for JIRA integration functionality
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-from integrations.jira_client import JiraClient
+from integrations.jira_client import JiraClient, TASK_LINE_RE
+from tests._runner import run_tests
 
 def test_jira_parsing():
     """Test JIRA task parsing functionality"""
@@ -36,6 +39,10 @@ def test_jira_parsing():
     - Add error handling for connection failures
     - _Requirements: 1.3, 8.1, 8.2_"""
 
+    # The shared pattern finds every checkbox in a single scan
+    checkbox_numbers = [m.group('num') for m in TASK_LINE_RE.finditer(sample_tasks) if m.group('num')]
+    assert checkbox_numbers == ["1", "1.1", "1.2", "2", "2.1"], f"Unexpected checkboxes: {checkbox_numbers}"
+    
     # Initialize JIRA client
     jira_client = JiraClient()
     
@@ -64,6 +71,32 @@ def test_jira_parsing():
     
     return True
 
+def test_jira_parsing_crlf_and_indent():
+    """Test parsing of CRLF markdown and indented top-level tasks"""
+    print("\n🧪 Testing JIRA task parsing with CRLF and indentation...")
+    
+    sample_tasks = (
+        " - [ ] 1. Set up\r\n"
+        "   - [ ] 1.1 Create folders\r\n"
+        "    - Add package files\r\n"
+        "    - _Requirements: 1.1, 8.1_\r\n"
+        "\r\n"
+        " - [ ] 2. Add Bedrock client\r\n"
+    )
+    
+    parsed_tasks = JiraClient().parse_tasks_from_markdown(sample_tasks)
+    
+    assert [task['number'] for task in parsed_tasks] == ["1", "2"], f"Unexpected tasks: {parsed_tasks}"
+    assert parsed_tasks[0]['title'] == "Set up", f"Unexpected title: {parsed_tasks[0]['title']!r}"
+    assert parsed_tasks[0]['subtasks'] == [{"number": "1.1", "title": "Create folders"}]
+    assert parsed_tasks[0]['requirements'] == ["1.1", "8.1"]
+    assert parsed_tasks[0]['description'] == "• Add package files"
+    assert parsed_tasks[1]['title'] == "Add Bedrock client"
+    
+    print("✅ CRLF line endings and indented tasks parse correctly")
+    
+    return True
+
 def test_jira_configuration():
     """Test JIRA configuration structure"""
     print("\n🔧 Testing JIRA configuration...")
@@ -74,6 +107,7 @@ def test_jira_configuration():
     assert hasattr(jira_client, 'configure'), "Missing configure method"
     assert hasattr(jira_client, 'test_connection'), "Missing test_connection method"
     assert hasattr(jira_client, 'create_ticket'), "Missing create_ticket method"
+    assert hasattr(jira_client, 'create_tickets_bulk'), "Missing create_tickets_bulk method"
     assert hasattr(jira_client, 'create_tickets_from_tasks'), "Missing create_tickets_from_tasks method"
     
     print("✅ All required JIRA methods are implemented")
@@ -88,14 +122,19 @@ def test_jira_configuration():
     return True
 
 if __name__ == "__main__":
-    success1 = test_jira_parsing()
-    success2 = test_jira_configuration()
+    success = run_tests([
+        ("JIRA task parsing", test_jira_parsing),
+        ("JIRA task parsing (CRLF and indentation)", test_jira_parsing_crlf_and_indent),
+        ("JIRA configuration", test_jira_configuration),
+    ])
     
-    if success1 and success2:
-        print("\n🎉 All JIRA integration tests passed!")
-        print("You can now use the JIRA Integration tab to:")
-        print("  • Configure your JIRA connection")
-        print("  • Create tickets from generated tasks")
-        print("  • Manage and track created tickets")
+    if success:
+        sys.stdout.write(
+            "\n🎉 All JIRA integration tests passed!\n"
+            "You can now use the JIRA Integration tab to:\n"
+            "  • Configure your JIRA connection\n"
+            "  • Create tickets from generated tasks\n"
+            "  • Manage and track created tickets\n"
+        )
     
-    sys.exit(0 if (success1 and success2) else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
\ No newline at end of file
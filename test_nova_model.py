@@ -5,15 +5,23 @@ Test script for Nova Pro model integration
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import logging
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from services.ai_service import AIService
+from tests._runner import LIVE_SKIP_REASON, live_tests_enabled, skip_unless_live
 import json
 
+logger = logging.getLogger(__name__)
+
 def test_nova_model():
     """Test Nova Pro model with correct payload format"""
     print("🧪 Testing Nova Pro model...")
     
+    skip_unless_live()
+    
     # Initialize AI service
     ai_service = AIService()
     
@@ -50,12 +58,14 @@ def test_nova_model():
         print("\n🎉 All Nova Pro tests passed!")
         return True
         
-    except Exception as e:
-        print(f"❌ Nova Pro test failed: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Nova Pro test failed")
         return False
 
 if __name__ == "__main__":
+    if not live_tests_enabled():
+        print(f"⏭️  {LIVE_SKIP_REASON}")
+        sys.exit(0)
+    logging.basicConfig(level=logging.INFO)
     success = test_nova_model()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -3,38 +3,36 @@
 Test script for Nova Pro payload format (without AWS dependencies)
 """
 
-import json
+from utils import json_utils
+
+# Default inference settings; each payload gets its own copy
+NOVA_INFERENCE_CONFIG = {
+    "max_new_tokens": 4096,
+    "temperature": 0.7
+}
+
+# Simulate the payload creation logic
+def prepare_nova_payload(prompt: str, system_prompt: str = None, inference_config: dict = None) -> dict:
+    """Prepare payload for Nova models"""
+    # Nova Pro expects content to be an array of content objects
+    payload = {
+        "messages": [{"role": "user", "content": [{"text": prompt}]}],
+        "inferenceConfig": {**NOVA_INFERENCE_CONFIG, **(inference_config or {})}
+    }
+    
+    if system_prompt:
+        payload["system"] = [{"text": system_prompt}]
+        
+    return payload
 
 def test_nova_payload_format():
     """Test Nova Pro payload format"""
     print("🧪 Testing Nova Pro payload format...")
     
-    # Simulate the payload creation logic
-    def prepare_nova_payload(prompt: str, system_prompt: str = None) -> dict:
-        """Prepare payload for Nova models"""
-        max_tokens = 4096
-        temperature = 0.7
-        
-        # Nova Pro expects content to be an array of content objects
-        messages = [{"role": "user", "content": [{"text": prompt}]}]
-        
-        payload = {
-            "messages": messages,
-            "inferenceConfig": {
-                "max_new_tokens": max_tokens,
-                "temperature": temperature
-            }
-        }
-        
-        if system_prompt:
-            payload["system"] = [{"text": system_prompt}]
-            
-        return payload
-    
     # Test basic payload
     print("\n📝 Testing basic payload...")
     basic_payload = prepare_nova_payload("Hello, can you tell me about yourself?")
-    print(f"✅ Basic payload: {json.dumps(basic_payload, indent=2)}")
+    print(f"✅ Basic payload: {json_utils.dumps(basic_payload, pretty=True)}")
     
     # Test payload with system prompt
     print("\n🔧 Testing payload with system prompt...")
@@ -42,7 +40,7 @@ def test_nova_payload_format():
         "Generate requirements for a todo app",
         "You are Kiro, an AI assistant for developers."
     )
-    print(f"✅ System payload: {json.dumps(system_payload, indent=2)}")
+    print(f"✅ System payload: {json_utils.dumps(system_payload, pretty=True)}")
     
     # Verify required fields
     print("\n✅ Verifying required fields...")
@@ -51,6 +49,11 @@ def test_nova_payload_format():
     assert "max_new_tokens" in basic_payload["inferenceConfig"], "Missing 'max_new_tokens' field"
     assert "temperature" in basic_payload["inferenceConfig"], "Missing 'temperature' field"
     
+    # Payloads must not share the default inference config
+    basic_payload["inferenceConfig"]["temperature"] = 0.0
+    assert system_payload["inferenceConfig"]["temperature"] == 0.7, "Inference config shared between payloads"
+    assert NOVA_INFERENCE_CONFIG["temperature"] == 0.7, "Default inference config was mutated"
+    
     print("✅ All payload format tests passed!")
     print("\n🎯 The Nova Pro payload now uses the correct 'messages' format instead of 'inputText'")
     
@@ -3,45 +3,90 @@
 Test script to verify all download options are available in offline mode
 """
 
+import sys
+from types import MappingProxyType
+
+from tests._runner import run_tests
+
+# Expected download options in offline mode
+EXPECTED_DOWNLOADS = (
+    "Production CSV",
+    "API JSON", 
+    "Production MD",
+    "Tasks.md"
+)
+
+# Expected file names
+EXPECTED_FILES = (
+    "jira_production_tickets.csv",
+    "jira_api_tickets.json",
+    "jira_production_tickets.md", 
+    "implementation_tasks.md"
+)
+
+# Expected help text
+EXPECTED_HELP = (
+    "23+ JIRA fields for Excel import",
+    "JIRA REST API ready format",
+    "Human-readable documentation",
+    "Kiro-compatible tasks format"
+)
+
+EXPECTED_PREVIEW_FORMATS = (
+    "Production Markdown",
+    "Tasks.md Format",
+    "CSV",
+    "JSON"
+)
+
+# Both modes should have the same 4 formats available
+CONSISTENT_FORMATS = (
+    "CSV (Production JIRA)",
+    "JSON (API ready)", 
+    "Markdown (Human readable)",
+    "Tasks.md (Kiro format)"
+)
+
+# File naming consistency
+FILE_PATTERNS = MappingProxyType({
+    "CSV": "jira_production*.csv",
+    "JSON": "jira_api*.json", 
+    "Markdown": "jira_production*.md",
+    "Tasks.md": "*tasks*.md"
+})
+
+WORKFLOW_STEPS = (
+    "1. Generate tasks in Spec Generation",
+    "2. Go to JIRA Integration tab",
+    "3. Select 'Offline Mode'",
+    "4. Configure production JIRA settings",
+    "5. Generate templates",
+    "6. Choose from 4 download formats:",
+    "   - Production CSV (23+ fields)",
+    "   - API JSON (REST API ready)",
+    "   - Production Markdown (documentation)",
+    "   - Tasks.md (Kiro format)",
+    "7. Preview any format",
+    "8. Download selected format(s)",
+    "9. Import into JIRA or continue in Kiro"
+)
+
+def _print_numbered(items):
+    """Print items as a numbered, indented list in one write"""
+    sys.stdout.write("".join(f"  {i}. {item}\n" for i, item in enumerate(items, 1)))
+
 def test_offline_download_options():
     """Test that offline mode includes all 4 download formats"""
     print("🧪 Testing offline mode download options...")
     
-    # Expected download options in offline mode
-    expected_downloads = [
-        "Production CSV",
-        "API JSON", 
-        "Production MD",
-        "Tasks.md"
-    ]
-    
-    print(f"✅ Expected {len(expected_downloads)} download options in offline mode:")
-    for i, option in enumerate(expected_downloads, 1):
-        print(f"  {i}. {option}")
-    
-    # Expected file names
-    expected_files = [
-        "jira_production_tickets.csv",
-        "jira_api_tickets.json",
-        "jira_production_tickets.md", 
-        "implementation_tasks.md"
-    ]
+    print(f"✅ Expected {len(EXPECTED_DOWNLOADS)} download options in offline mode:")
+    _print_numbered(EXPECTED_DOWNLOADS)
     
     print(f"\\n✅ Expected file names:")
-    for i, filename in enumerate(expected_files, 1):
-        print(f"  {i}. {filename}")
-    
-    # Expected help text
-    expected_help = [
-        "23+ JIRA fields for Excel import",
-        "JIRA REST API ready format",
-        "Human-readable documentation",
-        "Kiro-compatible tasks format"
-    ]
+    _print_numbered(EXPECTED_FILES)
     
     print(f"\\n✅ Expected help descriptions:")
-    for i, help_text in enumerate(expected_help, 1):
-        print(f"  {i}. {help_text}")
+    _print_numbered(EXPECTED_HELP)
     
     print("\\n🎯 Offline download options test completed!")
     return True
@@ -50,16 +95,8 @@ def test_preview_options():
     """Test that preview includes all formats"""
     print("\\n🖥️ Testing preview format options...")
     
-    expected_preview_formats = [
-        "Production Markdown",
-        "Tasks.md Format",
-        "CSV",
-        "JSON"
-    ]
-    
-    print(f"✅ Expected {len(expected_preview_formats)} preview formats:")
-    for i, fmt in enumerate(expected_preview_formats, 1):
-        print(f"  {i}. {fmt}")
+    print(f"✅ Expected {len(EXPECTED_PREVIEW_FORMATS)} preview formats:")
+    _print_numbered(EXPECTED_PREVIEW_FORMATS)
     
     print("\\n🎯 Preview options test completed!")
     return True
@@ -68,29 +105,11 @@ def test_ui_consistency():
     """Test UI consistency between online and offline modes"""
     print("\\n🔄 Testing UI consistency...")
     
-    # Both modes should have the same 4 formats available
-    formats = [
-        "CSV (Production JIRA)",
-        "JSON (API ready)", 
-        "Markdown (Human readable)",
-        "Tasks.md (Kiro format)"
-    ]
-    
     print("✅ Consistent formats across online/offline modes:")
-    for i, fmt in enumerate(formats, 1):
-        print(f"  {i}. {fmt}")
-    
-    # File naming consistency
-    file_patterns = {
-        "CSV": "jira_production*.csv",
-        "JSON": "jira_api*.json", 
-        "Markdown": "jira_production*.md",
-        "Tasks.md": "*tasks*.md"
-    }
+    _print_numbered(CONSISTENT_FORMATS)
     
     print("\\n✅ Consistent file naming patterns:")
-    for fmt, pattern in file_patterns.items():
-        print(f"  {fmt}: {pattern}")
+    sys.stdout.write("".join(f"  {fmt}: {pattern}\n" for fmt, pattern in FILE_PATTERNS.items()))
     
     print("\\n🎯 UI consistency test completed!")
     return True
@@ -99,50 +118,36 @@ def simulate_offline_workflow():
     """Simulate the complete offline workflow"""
     print("\\n🔄 Simulating complete offline workflow...")
     
-    workflow_steps = [
-        "1. Generate tasks in Spec Generation",
-        "2. Go to JIRA Integration tab",
-        "3. Select 'Offline Mode'",
-        "4. Configure production JIRA settings",
-        "5. Generate templates",
-        "6. Choose from 4 download formats:",
-        "   - Production CSV (23+ fields)",
-        "   - API JSON (REST API ready)",
-        "   - Production Markdown (documentation)",
-        "   - Tasks.md (Kiro format)",
-        "7. Preview any format",
-        "8. Download selected format(s)",
-        "9. Import into JIRA or continue in Kiro"
-    ]
-    
     print("✅ Complete offline workflow:")
-    for step in workflow_steps:
-        print(f"  {step}")
+    sys.stdout.write("".join(f"  {step}\n" for step in WORKFLOW_STEPS))
     
     print("\\n🎯 Offline workflow simulation completed!")
     return True
 
 if __name__ == "__main__":
-    success1 = test_offline_download_options()
-    success2 = test_preview_options() 
-    success3 = test_ui_consistency()
-    success4 = simulate_offline_workflow()
-    
-    if all([success1, success2, success3, success4]):
-        print("\\n🎉 All offline mode tests passed!")
-        print("\\n🚀 Offline Mode Features:")
-        print("  📊 Production CSV - 23+ JIRA fields for Excel")
-        print("  🔗 API JSON - Ready for JIRA REST API bulk import")
-        print("  📝 Production Markdown - Human-readable documentation")
-        print("  ✅ Tasks.md - Kiro-compatible format for continued development")
-        print("  👀 Preview - All formats with inline download")
-        print("  📥 Quick Downloads - All formats available instantly")
-        
-        print("\\n💡 Perfect for:")
-        print("  - Teams without direct JIRA access")
-        print("  - Bulk ticket preparation")
-        print("  - Review and approval workflows")
-        print("  - Continued development in Kiro")
-        print("  - Documentation and planning")
-    
-    exit(0 if all([success1, success2, success3, success4]) else 1)
\ No newline at end of file
+    success = run_tests([
+        ("Offline download options", test_offline_download_options),
+        ("Preview options", test_preview_options),
+        ("UI consistency", test_ui_consistency),
+        ("Offline workflow simulation", simulate_offline_workflow),
+    ])
+    
+    if success:
+        sys.stdout.write(
+            "\n🎉 All offline mode tests passed!\n"
+            "\n🚀 Offline Mode Features:\n"
+            "  📊 Production CSV - 23+ JIRA fields for Excel\n"
+            "  🔗 API JSON - Ready for JIRA REST API bulk import\n"
+            "  📝 Production Markdown - Human-readable documentation\n"
+            "  ✅ Tasks.md - Kiro-compatible format for continued development\n"
+            "  👀 Preview - All formats with inline download\n"
+            "  📥 Quick Downloads - All formats available instantly\n"
+            "\n💡 Perfect for:\n"
+            "  - Teams without direct JIRA access\n"
+            "  - Bulk ticket preparation\n"
+            "  - Review and approval workflows\n"
+            "  - Continued development in Kiro\n"
+            "  - Documentation and planning\n"
+        )
+    
+    sys.exit(0 if success else 1)
\ No newline at end of file
@@ -3,38 +3,41 @@
 Test script for offline JIRA template generation
 """
 
+import sys
+
+from utils import json_utils
+
+# Sample parsed tasks (simulating what would come from parse_tasks_from_markdown)
+SAMPLE_TASKS = (
+    {
+        "number": "1",
+        "title": "Set up project structure and dependencies",
+        "description": "• Create folders for services/, engines/, generators/, integrations/\n• Set up proper Python package structure with __init__.py files\n• Initialize project configuration files",
+        "subtasks": [
+            {"number": "1.1", "title": "Create directory structure for services and components"}
+        ],
+        "requirements": ["1.1", "8.1"],
+        "priority": "Medium"
+    },
+    {
+        "number": "2", 
+        "title": "Implement AWS Bedrock integration",
+        "description": "• Write AIService class with boto3 Bedrock client initialization\n• Implement EC2 IAM role authentication for AWS services\n• Add error handling for connection failures",
+        "subtasks": [
+            {"number": "2.1", "title": "Create AI service layer with Bedrock client"}
+        ],
+        "requirements": ["1.3", "8.1", "8.2"],
+        "priority": "Medium"
+    }
+)
+
 def test_template_generation():
     """Test offline JIRA template generation"""
     print("🧪 Testing offline JIRA template generation...")
     
-    # Sample parsed tasks (simulating what would come from parse_tasks_from_markdown)
-    sample_tasks = [
-        {
-            "number": "1",
-            "title": "Set up project structure and dependencies",
-            "description": "• Create folders for services/, engines/, generators/, integrations/\n• Set up proper Python package structure with __init__.py files\n• Initialize project configuration files",
-            "subtasks": [
-                {"number": "1.1", "title": "Create directory structure for services and components"}
-            ],
-            "requirements": ["1.1", "8.1"],
-            "priority": "Medium"
-        },
-        {
-            "number": "2", 
-            "title": "Implement AWS Bedrock integration",
-            "description": "• Write AIService class with boto3 Bedrock client initialization\n• Implement EC2 IAM role authentication for AWS services\n• Add error handling for connection failures",
-            "subtasks": [
-                {"number": "2.1", "title": "Create AI service layer with Bedrock client"}
-            ],
-            "requirements": ["1.3", "8.1", "8.2"],
-            "priority": "Medium"
-        }
-    ]
-    
     # Simulate the template generation function
     def generate_jira_templates(parsed_tasks, issue_type, priority, project_key, add_labels):
         """Generate JIRA ticket templates in different formats"""
-        import json
         import csv
         from io import StringIO
         
@@ -68,8 +71,8 @@ def test_template_generation():
         ])
         
         # CSV data
-        for ticket in template_data:
-            csv_writer.writerow([
+        csv_writer.writerows(
+            (
                 ticket["summary"],
                 ticket["description"],
                 ticket["issue_type"],
@@ -78,7 +81,9 @@ def test_template_generation():
                 "; ".join(ticket["labels"]),
                 "; ".join(ticket["requirements"]),
                 "; ".join(ticket["subtasks"])
-            ])
+            )
+            for ticket in template_data
+        )
         
         csv_content = csv_buffer.getvalue()
         
@@ -100,31 +105,32 @@ def test_template_generation():
             
             json_tickets.append(json_ticket)
         
-        json_content = json.dumps({"issues": json_tickets}, indent=2)
+        json_content = json_utils.dumps({"issues": json_tickets}, pretty=True)
         
         # Generate Markdown format
-        md_content = "# JIRA Ticket Templates\n\n"
-        md_content += f"**Project:** {project_key}\n"
-        md_content += f"**Issue Type:** {issue_type}\n"
-        md_content += f"**Priority:** {priority}\n\n"
+        md_parts = ["# JIRA Ticket Templates\n\n"]
+        md_parts.append(f"**Project:** {project_key}\n")
+        md_parts.append(f"**Issue Type:** {issue_type}\n")
+        md_parts.append(f"**Priority:** {priority}\n\n")
         
         for i, ticket in enumerate(template_data, 1):
-            md_content += f"## Ticket {i}: {ticket['summary']}\n\n"
-            md_content += f"**Description:**\n{ticket['description']}\n\n"
+            md_parts.append(f"## Ticket {i}: {ticket['summary']}\n\n")
+            md_parts.append(f"**Description:**\n{ticket['description']}\n\n")
             
             if ticket["requirements"]:
-                md_content += f"**Requirements:** {', '.join(ticket['requirements'])}\n\n"
+                md_parts.append(f"**Requirements:** {', '.join(ticket['requirements'])}\n\n")
             
             if ticket["subtasks"]:
-                md_content += f"**Subtasks:**\n"
-                for subtask in ticket["subtasks"]:
-                    md_content += f"- {subtask}\n"
-                md_content += "\n"
+                md_parts.append(f"**Subtasks:**\n")
+                md_parts.extend(f"- {subtask}\n" for subtask in ticket["subtasks"])
+                md_parts.append("\n")
             
             if ticket["labels"]:
-                md_content += f"**Labels:** {', '.join(ticket['labels'])}\n\n"
+                md_parts.append(f"**Labels:** {', '.join(ticket['labels'])}\n\n")
             
-            md_content += "---\n\n"
+            md_parts.append("---\n\n")
+        
+        md_content = "".join(md_parts)
         
         return {
             "csv": csv_content,
@@ -135,7 +141,7 @@ def test_template_generation():
     
     # Generate templates
     templates = generate_jira_templates(
-        sample_tasks,
+        SAMPLE_TASKS,
         "Task",
         "Medium", 
         "KIRO",
@@ -145,9 +151,9 @@ def test_template_generation():
     print(f"✅ Generated templates for {templates['count']} tickets")
     
     # Test CSV format
-    csv_lines = templates['csv'].split('\n')
-    assert len(csv_lines) >= 3, "CSV should have header + 2 data rows"
-    assert "Summary,Description,Issue Type" in csv_lines[0], "CSV header incorrect"
+    csv_header = templates['csv'].partition('\n')[0]
+    assert templates['csv'].count('\n') + 1 >= 3, "CSV should have header + 2 data rows"
+    assert "Summary,Description,Issue Type" in csv_header, "CSV header incorrect"
     print("✅ CSV template format is correct")
     
     # Test JSON format
@@ -178,10 +184,12 @@ if __name__ == "__main__":
     success = test_template_generation()
     
     if success:
-        print("\n🎉 Offline JIRA template generation is working!")
-        print("You can now use both modes:")
-        print("  🌐 Online Mode: Create tickets directly in JIRA")
-        print("  📱 Offline Mode: Generate templates for download")
-        print("  📄 Formats: CSV (Excel), JSON (API), Markdown (readable)")
+        sys.stdout.write(
+            "\n🎉 Offline JIRA template generation is working!\n"
+            "You can now use both modes:\n"
+            "  🌐 Online Mode: Create tickets directly in JIRA\n"
+            "  📱 Offline Mode: Generate templates for download\n"
+            "  📄 Formats: CSV (Excel), JSON (API), Markdown (readable)\n"
+        )
     
-    exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
\ No newline at end of file
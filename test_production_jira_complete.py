@@ -3,38 +3,50 @@
 Complete test for production-grade JIRA integration with all formats
 """
 
+import sys
+
+from tests._runner import run_tests
+from utils import json_utils
+
+# Acceptance criteria shared by every generated ticket
+STANDARD_ACCEPTANCE_CRITERIA = (
+    "Code review passed",
+    "Unit tests written and passing",
+    "Documentation updated"
+)
+
+# Sample parsed tasks (realistic example)
+SAMPLE_TASKS = (
+    {
+        "number": "1",
+        "title": "Set up AWS Bedrock integration infrastructure",
+        "description": "• Create AIService class with boto3 Bedrock client initialization\n• Implement EC2 IAM role authentication for AWS services\n• Add error handling for connection failures and rate limiting\n• Set up logging and monitoring for AI service calls",
+        "subtasks": [
+            {"number": "1.1", "title": "Create AI service layer with Bedrock client"},
+            {"number": "1.2", "title": "Add model selection and switching functionality"},
+            {"number": "1.3", "title": "Implement error handling and retry logic"}
+        ],
+        "requirements": ["1.3", "8.1", "8.2"],
+        "priority": "High"
+    },
+    {
+        "number": "2", 
+        "title": "Implement JIRA integration with production-grade templates",
+        "description": "• Build comprehensive JIRA client with full field support\n• Generate production-ready templates in multiple formats\n• Add tasks.md format for Kiro compatibility\n• Include advanced configuration options",
+        "subtasks": [
+            {"number": "2.1", "title": "Create JIRA client with comprehensive field mapping"},
+            {"number": "2.2", "title": "Implement template generation for all formats"},
+            {"number": "2.3", "title": "Add UI for advanced JIRA configuration"}
+        ],
+        "requirements": ["2.1", "2.2", "3.1"],
+        "priority": "High"
+    }
+)
+
 def test_production_jira_complete():
     """Test complete production-grade JIRA implementation"""
     print("🧪 Testing complete production-grade JIRA integration...")
     
-    # Sample parsed tasks (realistic example)
-    sample_tasks = [
-        {
-            "number": "1",
-            "title": "Set up AWS Bedrock integration infrastructure",
-            "description": "• Create AIService class with boto3 Bedrock client initialization\n• Implement EC2 IAM role authentication for AWS services\n• Add error handling for connection failures and rate limiting\n• Set up logging and monitoring for AI service calls",
-            "subtasks": [
-                {"number": "1.1", "title": "Create AI service layer with Bedrock client"},
-                {"number": "1.2", "title": "Add model selection and switching functionality"},
-                {"number": "1.3", "title": "Implement error handling and retry logic"}
-            ],
-            "requirements": ["1.3", "8.1", "8.2"],
-            "priority": "High"
-        },
-        {
-            "number": "2", 
-            "title": "Implement JIRA integration with production-grade templates",
-            "description": "• Build comprehensive JIRA client with full field support\n• Generate production-ready templates in multiple formats\n• Add tasks.md format for Kiro compatibility\n• Include advanced configuration options",
-            "subtasks": [
-                {"number": "2.1", "title": "Create JIRA client with comprehensive field mapping"},
-                {"number": "2.2", "title": "Implement template generation for all formats"},
-                {"number": "2.3", "title": "Add UI for advanced JIRA configuration"}
-            ],
-            "requirements": ["2.1", "2.2", "3.1"],
-            "priority": "High"
-        }
-    ]
-    
     # Test production template generation
     from datetime import datetime, timedelta
     import json
@@ -43,16 +55,28 @@ def test_production_jira_complete():
     
     def generate_production_templates(parsed_tasks, issue_type="Story", priority="High", project_key="KIRO", add_labels=True, assignee="john.doe", epic_link="KIRO-100", story_points="", components="Backend,API", fix_versions="v1.0.0", affects_versions="v0.9.0"):
         """Generate production-grade JIRA templates"""
+        now = datetime.now()
+        creation_date = now.strftime("%Y-%m-%d %H:%M:%S")
+        due_dates_by_points = {}
+        
+        # Invariant across tickets, so split once and share by reference
+        components_list = components.split(",") if components else ["Development"]
+        fix_versions_list = fix_versions.split(",") if fix_versions else []
+        affects_versions_list = affects_versions.split(",") if affects_versions else []
+        labels = ("kiro-generated", "implementation") if add_labels else ()
         template_data = []
         
         for i, task in enumerate(parsed_tasks, 1):
-            labels = ["kiro-generated", "implementation"] if add_labels else []
-            estimated_points = len(task.get("subtasks", [])) + 2 if not story_points else int(story_points)
+            title = task["title"]
+            subtasks = task.get("subtasks", ())
+            estimated_points = len(subtasks) + 2 if not story_points else int(story_points)
+            if estimated_points not in due_dates_by_points:
+                due_dates_by_points[estimated_points] = (now + timedelta(days=estimated_points * 2)).strftime("%Y-%m-%d")
             
             ticket_data = {
                 # Core fields
-                "summary": task["title"],
-                "description": task["description"] if task["description"] else f"Implementation task: {task['title']}",
+                "summary": title,
+                "description": task["description"] or f"Implementation task: {title}",
                 "issue_type": issue_type,
                 "priority": priority,
                 "project_key": project_key,
@@ -68,26 +92,21 @@ def test_production_jira_complete():
                 "remaining_estimate": f"{estimated_points * 4}h",
                 
                 # Versioning
-                "fix_versions": fix_versions.split(",") if fix_versions else [],
-                "affects_versions": affects_versions.split(",") if affects_versions else [],
+                "fix_versions": fix_versions_list,
+                "affects_versions": affects_versions_list,
                 
                 # Components and labels
-                "components": components.split(",") if components else ["Development"],
+                "components": components_list,
                 "labels": labels,
                 
                 # Custom fields
                 "environment": "Development",
-                "due_date": (datetime.now() + timedelta(days=estimated_points * 2)).strftime("%Y-%m-%d"),
+                "due_date": due_dates_by_points[estimated_points],
                 
                 # Kiro-specific fields
-                "requirements": task.get("requirements", []),
-                "subtasks": [st["title"] for st in task.get("subtasks", [])],
-                "acceptance_criteria": [
-                    f"Complete implementation of {task['title']}",
-                    "Code review passed",
-                    "Unit tests written and passing",
-                    "Documentation updated"
-                ],
+                "requirements": task.get("requirements", ()),
+                "subtasks": [subtask["title"] for subtask in subtasks],
+                "acceptance_criteria": (f"Complete implementation of {title}",) + STANDARD_ACCEPTANCE_CRITERIA,
                 
                 # Status and workflow
                 "status": "To Do",
@@ -95,51 +114,49 @@ def test_production_jira_complete():
                 
                 # Additional metadata
                 "created_by": "Kiro AI Assistant",
-                "creation_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "creation_date": creation_date,
                 "task_number": task.get("number", str(i))
             }
             
             template_data.append(ticket_data)
         
         # Generate Tasks.md format (Kiro-style)
-        tasks_md_content = "# Implementation Tasks (JIRA Export)\\n\\n"
-        tasks_md_content += f"Generated from Kiro on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\\n\\n"
+        tasks_md_parts = ["# Implementation Tasks (JIRA Export)\\n\\n"]
+        tasks_md_parts.append(f"Generated from Kiro on {creation_date}\\n\\n")
         
         for i, ticket in enumerate(template_data, 1):
             # Main task checkbox
-            tasks_md_content += f"- [ ] {ticket['task_number']}. {ticket['summary']}\\n"
+            tasks_md_parts.append(f"- [ ] {ticket['task_number']}. {ticket['summary']}\\n")
             
             # Task details
-            tasks_md_content += f"  - **Priority:** {ticket['priority']}\\n"
-            tasks_md_content += f"  - **Story Points:** {ticket['story_points']}\\n"
-            tasks_md_content += f"  - **Estimate:** {ticket['original_estimate']}\\n"
-            tasks_md_content += f"  - **Due Date:** {ticket['due_date']}\\n"
+            tasks_md_parts.append(f"  - **Priority:** {ticket['priority']}\\n")
+            tasks_md_parts.append(f"  - **Story Points:** {ticket['story_points']}\\n")
+            tasks_md_parts.append(f"  - **Estimate:** {ticket['original_estimate']}\\n")
+            tasks_md_parts.append(f"  - **Due Date:** {ticket['due_date']}\\n")
             
             if ticket["assignee"]:
-                tasks_md_content += f"  - **Assignee:** {ticket['assignee']}\\n"
+                tasks_md_parts.append(f"  - **Assignee:** {ticket['assignee']}\\n")
             
             # Description
             if ticket["description"]:
-                desc_lines = ticket["description"].split('\\n')
-                for line in desc_lines:
-                    if line.strip():
-                        tasks_md_content += f"  - {line.strip()}\\n"
+                tasks_md_parts.extend(f"  - {line.strip()}\\n" for line in ticket["description"].split('\\n') if line.strip())
             
             # Subtasks
             if ticket["subtasks"]:
                 for j, subtask in enumerate(ticket["subtasks"], 1):
-                    tasks_md_content += f"  - [ ] {ticket['task_number']}.{j} {subtask}\\n"
+                    tasks_md_parts.append(f"  - [ ] {ticket['task_number']}.{j} {subtask}\\n")
             
             # Requirements reference
             if ticket["requirements"]:
-                tasks_md_content += f"  - _Requirements: {', '.join(ticket['requirements'])}_\\n"
+                tasks_md_parts.append(f"  - _Requirements: {', '.join(ticket['requirements'])}_\\n")
             
             # Acceptance criteria
-            tasks_md_content += f"  - **Acceptance Criteria:**\\n"
-            for criteria in ticket["acceptance_criteria"]:
-                tasks_md_content += f"    - {criteria}\\n"
+            tasks_md_parts.append(f"  - **Acceptance Criteria:**\\n")
+            tasks_md_parts.extend(f"    - {criteria}\\n" for criteria in ticket["acceptance_criteria"])
             
-            tasks_md_content += "\\n"
+            tasks_md_parts.append("\\n")
+        
+        tasks_md_content = "".join(tasks_md_parts)
         
         # Generate CSV with all production fields
         csv_buffer = StringIO()
@@ -154,9 +171,15 @@ def test_production_jira_complete():
             "Created By", "Creation Date", "Task Number"
         ])
         
+        # List settings shared by every ticket are joined once for the whole sheet
+        components_csv = "; ".join(components_list)
+        fix_versions_csv = "; ".join(fix_versions_list)
+        affects_versions_csv = "; ".join(affects_versions_list)
+        labels_csv = "; ".join(labels)
+        
         # CSV data
-        for ticket in template_data:
-            csv_writer.writerow([
+        csv_writer.writerows(
+            (
                 ticket["summary"],
                 ticket["description"],
                 ticket["issue_type"],
@@ -167,10 +190,10 @@ def test_production_jira_complete():
                 ticket["story_points"],
                 ticket["epic_link"],
                 ticket["original_estimate"],
-                "; ".join(ticket["components"]),
-                "; ".join(ticket["fix_versions"]),
-                "; ".join(ticket["affects_versions"]),
-                "; ".join(ticket["labels"]),
+                components_csv,
+                fix_versions_csv,
+                affects_versions_csv,
+                labels_csv,
                 ticket["environment"],
                 ticket["due_date"],
                 ticket["status"],
@@ -180,7 +203,9 @@ def test_production_jira_complete():
                 ticket["created_by"],
                 ticket["creation_date"],
                 ticket["task_number"]
-            ])
+            )
+            for ticket in template_data
+        )
         
         csv_content = csv_buffer.getvalue()
         
@@ -211,7 +236,7 @@ def test_production_jira_complete():
             
             json_tickets.append(json_ticket)
         
-        json_content = json.dumps({"issues": json_tickets}, indent=2)
+        json_content = json_utils.dumps({"issues": json_tickets}, pretty=True)
         
         return {
             "csv": csv_content,
@@ -221,19 +246,20 @@ def test_production_jira_complete():
         }
     
     # Generate templates
-    templates = generate_production_templates(sample_tasks)
+    templates = generate_production_templates(SAMPLE_TASKS)
     
     print(f"✅ Generated production templates for {templates['count']} tickets")
     
     # Test CSV format (production-grade)
     csv_content = templates['csv']
-    csv_lines = csv_content.split('\\n')
-    headers = csv_lines[0].split(',')
+    csv_rows = list(csv.reader(StringIO(csv_content)))
+    headers = set(csv_rows[0])
     
-    assert len(headers) >= 23, f"Expected 23+ CSV headers, got {len(headers)}"
-    assert "Story Points" in csv_content, "Story Points field missing"
-    assert "Epic Link" in csv_content, "Epic Link field missing"
-    assert "Acceptance Criteria" in csv_content, "Acceptance Criteria field missing"
+    assert len(csv_rows[0]) >= 23, f"Expected 23+ CSV headers, got {len(csv_rows[0])}"
+    assert len(csv_rows) - 1 == len(SAMPLE_TASKS), f"Expected {len(SAMPLE_TASKS)} CSV rows, got {len(csv_rows) - 1}"
+    assert "Story Points" in headers, "Story Points field missing"
+    assert "Epic Link" in headers, "Epic Link field missing"
+    assert "Acceptance Criteria" in headers, "Acceptance Criteria field missing"
     print("✅ Production CSV format validated (23+ fields)")
     
     # Test JSON format (API ready)
@@ -266,8 +292,8 @@ def test_production_jira_complete():
         "Due Date", "Status", "Requirements", "Subtasks", "Acceptance Criteria"
     ]
     
-    for field in expected_production_fields:
-        assert field in csv_content, f"Production field '{field}' missing from CSV"
+    missing_fields = set(expected_production_fields) - headers
+    assert not missing_fields, f"Production fields missing from CSV: {sorted(missing_fields)}"
     
     print(f"✅ All {len(expected_production_fields)} production fields validated")
     
@@ -296,24 +322,27 @@ def test_ui_format_options():
     return True
 
 if __name__ == "__main__":
-    success1 = test_production_jira_complete()
-    success2 = test_ui_format_options()
+    success = run_tests([
+        ("Production JIRA templates", test_production_jira_complete),
+        ("UI format options", test_ui_format_options),
+    ])
     
-    if success1 and success2:
-        print("\\n🎉 Complete production-grade JIRA integration validated!")
-        print("\\n🚀 Available Features:")
-        print("  📊 Production CSV - 23+ JIRA fields for Excel import")
-        print("  🔗 JSON API - Ready for JIRA REST API bulk import")
-        print("  📝 Production Markdown - Human-readable with all fields")
-        print("  ✅ Tasks.md Format - Kiro-compatible for continued development")
-        print("  ⚙️ Advanced Configuration - Assignee, Epic, Story Points, etc.")
-        print("  🌐 Online/Offline Modes - Direct JIRA or template generation")
-        print("  📥 Quick Downloads - All formats available instantly")
-        
-        print("\\n💡 Perfect for:")
-        print("  - Enterprise JIRA environments")
-        print("  - Project management workflows") 
-        print("  - Development team coordination")
-        print("  - Spec-driven development with Kiro")
+    if success:
+        sys.stdout.write(
+            "\n🎉 Complete production-grade JIRA integration validated!\n"
+            "\n🚀 Available Features:\n"
+            "  📊 Production CSV - 23+ JIRA fields for Excel import\n"
+            "  🔗 JSON API - Ready for JIRA REST API bulk import\n"
+            "  📝 Production Markdown - Human-readable with all fields\n"
+            "  ✅ Tasks.md Format - Kiro-compatible for continued development\n"
+            "  ⚙️ Advanced Configuration - Assignee, Epic, Story Points, etc.\n"
+            "  🌐 Online/Offline Modes - Direct JIRA or template generation\n"
+            "  📥 Quick Downloads - All formats available instantly\n"
+            "\n💡 Perfect for:\n"
+            "  - Enterprise JIRA environments\n"
+            "  - Project management workflows\n"
+            "  - Development team coordination\n"
+            "  - Spec-driven development with Kiro\n"
+        )
     
-    exit(0 if (success1 and success2) else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
\ No newline at end of file
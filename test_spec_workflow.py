@@ -7,15 +7,20 @@ import sys
 import os
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from services.ai_service import AIService
+from tests._runner import LIVE_SKIP_REASON, live_tests_enabled, skip_unless_live
 
 def test_spec_workflow():
     """Test the complete spec generation workflow"""
     print("🧪 Testing Spec Generation Workflow...")
     print("=" * 50)
     
+    skip_unless_live()
+    
     try:
         # Initialize AI service
         print("1. Initializing AI Service...")
@@ -81,10 +86,12 @@ def test_spec_workflow():
             print(f"   ❌ Task generation failed: {e}")
             return False
         
-        print("\n" + "=" * 50)
-        print("✅ All spec workflow tests passed!")
-        print("\n💡 The spec generation functionality is working correctly.")
-        print("   You can now use the Streamlit app to generate complete specifications.")
+        sys.stdout.write(
+            "\n" + "=" * 50 + "\n"
+            "✅ All spec workflow tests passed!\n"
+            "\n💡 The spec generation functionality is working correctly.\n"
+            "   You can now use the Streamlit app to generate complete specifications.\n"
+        )
         
         return True
         
@@ -93,5 +100,8 @@ def test_spec_workflow():
         return False
 
 if __name__ == "__main__":
+    if not live_tests_enabled():
+        print(f"⏭️  {LIVE_SKIP_REASON}")
+        sys.exit(0)
     success = test_spec_workflow()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -3,6 +3,8 @@
 Test script for task generation in Kiro markdown format
 """
 
+import sys
+
 def test_task_format():
     """Test the expected Kiro task format"""
     print("🧪 Testing Kiro task format...")
@@ -58,8 +60,10 @@ def test_task_format():
     assert "Create" in sample_tasks or "Implement" in sample_tasks, "Missing implementation details"
     print("✅ Contains implementation details")
     
-    print("\n🎯 Task format validation passed!")
-    print("The generated tasks will now be in proper Kiro markdown format instead of JSON.")
+    sys.stdout.write(
+        "\n🎯 Task format validation passed!\n"
+        "The generated tasks will now be in proper Kiro markdown format instead of JSON.\n"
+    )
     
     return True
 
@@ -0,0 +1,37 @@
+"""
+Shared driver for the standalone test scripts
+"""
+
+import os
+import sys
+import unittest
+
+# Live Bedrock invocations cost money and time, so they are opt-in
+LIVE_SKIP_REASON = "Skipping live Bedrock calls (set KIRO_TEST_LIVE=1 to run them)"
+
+def live_tests_enabled() -> bool:
+    """Whether live Bedrock tests were opted into with KIRO_TEST_LIVE=1"""
+    return os.environ.get("KIRO_TEST_LIVE") == "1"
+
+def skip_unless_live():
+    """Skip the calling test under pytest or unittest unless live tests are enabled"""
+    if not live_tests_enabled():
+        raise unittest.SkipTest(LIVE_SKIP_REASON)
+
+def run_tests(tests):
+    """Run (name, function) pairs, print one summary and return True if all passed"""
+    lines = ["\n📊 Test Results:"]
+    passed = 0
+    
+    for name, test_func in tests:
+        try:
+            ok = bool(test_func())
+        except Exception as e:
+            ok = False
+            lines.append(f"  💥 {name} raised {type(e).__name__}: {e}")
+        passed += ok
+        lines.append(f"  {'✅' if ok else '❌'} {name}")
+    
+    lines.append(f"\n{passed}/{len(tests)} tests passed")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return passed == len(tests)
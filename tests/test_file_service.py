@@ -2,20 +2,25 @@
 Unit tests for file service
 """
 import unittest
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, MagicMock
 import tempfile
 import os
 import sys
+from pathlib import Path
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from services.file_service import FileService
 
 class TestFileService(unittest.TestCase):
     
-    def setUp(self):
-        self.file_service = FileService()
+    @classmethod
+    def setUpClass(cls):
+        # FileService holds no per-call state, so one instance serves every test
+        cls.file_service = FileService()
     
     def test_filter_text_files(self):
         """Test filtering of text files"""
@@ -63,30 +68,50 @@ class TestFileService(unittest.TestCase):
         result = self.file_service.validate_folder_path('/invalid/path')
         self.assertFalse(result['valid'])
     
-    @patch('builtins.open', new_callable=mock_open, read_data='file content')
-    @patch('os.walk')
-    def test_read_folder_files(self, mock_walk, mock_file):
+    @patch('services.file_service.st')
+    def test_read_files(self, mock_st):
         """Test reading files from folder"""
-        mock_walk.return_value = [
-            ('/test', [], ['file1.py', 'file2.txt']),
-            ('/test/sub', [], ['file3.js'])
-        ]
-        
-        with patch.object(self.file_service, 'is_text_file', return_value=True):
-            files = self.file_service.read_folder_files('/test')
+        # A small real tree exercises the actual walk and read paths
+        with tempfile.TemporaryDirectory() as test_dir:
+            os.mkdir(os.path.join(test_dir, 'sub'))
+            for relative_path in ('file1.py', 'file2.txt', os.path.join('sub', 'file3.js'), 'image.jpg'):
+                with open(os.path.join(test_dir, relative_path), 'w') as f:
+                    f.write('file content')
+            
+            files = self.file_service.read_files(test_dir)
             
             self.assertEqual(len(files), 3)
-            self.assertIn('file1.py', files)
+            self.assertEqual(files['file1.py'], 'file content')
             self.assertIn('file2.txt', files)
-            self.assertIn('file3.js', files)
+            self.assertIn(os.path.join('sub', 'file3.js'), files)
+    
+    @patch('services.file_service.st')
+    def test_read_files_skips_large_files(self, mock_st):
+        """Test that files over max_file_size are left out"""
+        file_service = FileService()
+        file_service.max_file_size = 10
+        with tempfile.TemporaryDirectory() as test_dir:
+            for name, content in (('small.py', 'x = 1'), ('large.py', 'x = 1' * 10)):
+                with open(os.path.join(test_dir, name), 'w') as f:
+                    f.write(content)
+            
+            files = file_service.read_files(test_dir)
+        
+        self.assertEqual(files, {'small.py': 'x = 1'})
     
     def test_is_text_file(self):
         """Test text file detection"""
-        self.assertTrue(self.file_service.is_text_file('test.py'))
-        self.assertTrue(self.file_service.is_text_file('readme.md'))
-        self.assertTrue(self.file_service.is_text_file('config.json'))
-        self.assertFalse(self.file_service.is_text_file('image.jpg'))
-        self.assertFalse(self.file_service.is_text_file('data.bin'))
+        cases = [
+            ('test.py', True),
+            ('readme.md', True),
+            ('config.json', True),
+            ('image.jpg', False),
+            ('data.bin', False)
+        ]
+        
+        for filename, expected in cases:
+            with self.subTest(filename=filename):
+                self.assertIs(self.file_service.is_text_file(Path(filename)), expected)
     
     def test_analyze_code_structure(self):
         """Test code structure analysis"""
@@ -0,0 +1,47 @@
+"""
+Unit tests for the health check cache
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+
+# Add parent directory to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.health_cache import HealthCheckCache, HEALTH_CHECK_TTL
+
+class TestHealthCheckCache(unittest.TestCase):
+    
+    @patch('utils.health_cache.time.monotonic')
+    def test_result_reused_within_ttl(self, mock_monotonic):
+        """Test that a check runs once per TTL window and per name"""
+        cache = HealthCheckCache()
+        check = MagicMock(return_value={"status": "healthy"})
+        
+        mock_monotonic.return_value = 100.0
+        cache.get_or_run("aws", check)
+        mock_monotonic.return_value = 100.0 + HEALTH_CHECK_TTL - 1
+        cache.get_or_run("aws", check)
+        self.assertEqual(check.call_count, 1)
+        
+        cache.get_or_run("disk", check)
+        self.assertEqual(check.call_count, 2)
+        
+        mock_monotonic.return_value = 100.0 + HEALTH_CHECK_TTL
+        cache.get_or_run("aws", check)
+        self.assertEqual(check.call_count, 3)
+    
+    def test_returns_copies(self):
+        """Test that callers cannot mutate the cached result"""
+        cache = HealthCheckCache()
+        
+        first = cache.get_or_run("aws", lambda: {"status": "healthy"})
+        first["status"] = "changed"
+        
+        self.assertEqual(cache.get_or_run("aws", lambda: {}), {"status": "healthy"})
+
+if __name__ == '__main__':
+    unittest.main()
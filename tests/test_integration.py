@@ -7,21 +7,34 @@ import sys
 import os
 import tempfile
 import json
+from pathlib import Path
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 class TestAWSBedrockIntegration(unittest.TestCase):
     """Test AWS Bedrock integration"""
     
-    @patch('boto3.Session')
-    def test_bedrock_connection(self, mock_session):
+    @classmethod
+    def setUpClass(cls):
+        # Every test here needs boto3.Session patched, so patch it once for
+        # the class and only reset the mock between tests
+        session_patcher = patch('boto3.Session')
+        cls.mock_session = session_patcher.start()
+        cls.addClassCleanup(session_patcher.stop)
+    
+    def setUp(self):
+        self.mock_session.reset_mock(return_value=True, side_effect=True)
+    
+    def test_bedrock_connection(self):
         """Test AWS Bedrock connection"""
         from services.ai_service import AIService
         
         # Mock successful connection
         mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
+        self.mock_session.return_value.client.return_value = mock_client
         mock_client.list_foundation_models.return_value = {
             'modelSummaries': [
                 {'modelId': 'anthropic.claude-3-5-sonnet-20241022-v2:0'},
@@ -35,13 +48,12 @@ class TestAWSBedrockIntegration(unittest.TestCase):
         self.assertTrue(result['connected'])
         mock_client.list_foundation_models.assert_called_once()
     
-    @patch('boto3.Session')
-    def test_bedrock_model_invocation(self, mock_session):
+    def test_bedrock_model_invocation(self):
         """Test model invocation"""
         from services.ai_service import AIService
         
         mock_client = MagicMock()
-        mock_session.return_value.client.return_value = mock_client
+        self.mock_session.return_value.client.return_value = mock_client
         
         # Mock successful model response
         mock_response = {
@@ -65,11 +77,9 @@ class TestEndToEndSpecWorkflow(unittest.TestCase):
     """Test complete spec generation workflow"""
     
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.temp_dir = temp.name
     
     @patch('services.ai_service.AIService')
     @patch('services.file_service.FileService')
@@ -159,11 +169,15 @@ class TestEndToEndSpecWorkflow(unittest.TestCase):
 class TestFileProcessingIntegration(unittest.TestCase):
     """Test file processing integration"""
     
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read the tree, so write it once for the whole class
+        temp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(temp.cleanup)
+        cls.temp_dir = temp.name
         
         # Create test files
-        self.test_files = {
+        cls.test_files = {
             'main.py': 'print("Hello World")\ndef main():\n    pass',
             'utils.js': 'function helper() {\n    return "help";\n}',
             'README.md': '# Test Project\n\nThis is a test project.',
@@ -171,15 +185,9 @@ class TestFileProcessingIntegration(unittest.TestCase):
             'binary.jpg': b'\x89PNG\r\n\x1a\n'  # Binary data
         }
         
-        for filename, content in self.test_files.items():
-            filepath = os.path.join(self.temp_dir, filename)
-            mode = 'wb' if isinstance(content, bytes) else 'w'
-            with open(filepath, mode) as f:
-                f.write(content)
-    
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.temp_dir)
+        for filename, content in cls.test_files.items():
+            data = content if isinstance(content, bytes) else content.encode()
+            Path(cls.temp_dir, filename).write_bytes(data)
     
     def test_folder_analysis_integration(self):
         """Test complete folder analysis"""
@@ -0,0 +1,97 @@
+"""
+Unit tests for the JIRA client
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import json
+
+# Add parent directory to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from integrations.jira_client import JiraClient, JIRA_BULK_CREATE_LIMIT
+
+def _response(status_code, body=None):
+    """Build a stand-in for a requests.Response"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body or {}
+    response.text = json.dumps(body or {})
+    return response
+
+class TestCreateTicketsBulk(unittest.TestCase):
+    
+    def setUp(self):
+        st_patcher = patch('integrations.jira_client.st')
+        self.mock_st = st_patcher.start()
+        self.addCleanup(st_patcher.stop)
+        
+        self.client = JiraClient()
+        self.client.base_url = "https://jira.example"
+        self.client.project_key = "KIRO"
+        self.client.session = MagicMock()
+    
+    def test_batches_and_partial_failures(self):
+        """Test batching, a mid-batch rejection and a failed batch"""
+        tickets = [{"summary": f"Task {i}", "description": "details"} for i in range(120)]
+        batch_sizes = []
+        
+        def post(url, data):
+            updates = json.loads(data)["issueUpdates"]
+            batch_sizes.append(len(updates))
+            numbers = [int(update["fields"]["summary"].split()[1]) for update in updates]
+            
+            if len(batch_sizes) == 2:
+                # Element 3 of the second batch (ticket 53) is rejected
+                issues = [{"key": f"KIRO-{n}", "id": str(n)} for i, n in enumerate(numbers) if i != 3]
+                errors = [{
+                    "status": 400,
+                    "failedElementNumber": 3,
+                    "elementErrors": {"errorMessages": [], "errors": {"summary": "invalid"}}
+                }]
+                return _response(201, {"issues": issues, "errors": errors})
+            
+            if len(batch_sizes) == 3:
+                return _response(500, {"errorMessages": ["server error"]})
+            
+            return _response(201, {"issues": [{"key": f"KIRO-{n}", "id": str(n)} for n in numbers]})
+        
+        self.client.session.post.side_effect = post
+        
+        results = self.client.create_tickets_bulk(tickets)
+        
+        self.assertEqual(batch_sizes, [JIRA_BULK_CREATE_LIMIT, JIRA_BULK_CREATE_LIMIT, 20])
+        self.assertEqual(len(results), 120)
+        self.assertEqual(results[0], {"key": "KIRO-0", "id": "0", "url": "https://jira.example/browse/KIRO-0"})
+        self.assertEqual(results[52]["key"], "KIRO-52")
+        self.assertIsNone(results[53])
+        self.assertEqual(results[54]["key"], "KIRO-54")
+        self.assertEqual(results[99]["key"], "KIRO-99")
+        self.assertEqual(results[100:], [None] * 20)
+    
+    def test_all_rejected_batch(self):
+        """Test a 400 response where JIRA created nothing"""
+        errors = [{"status": 400, "failedElementNumber": i, "elementErrors": {}} for i in range(2)]
+        self.client.session.post.return_value = _response(400, {"issues": [], "errors": errors})
+        
+        results = self.client.create_tickets_bulk([
+            {"summary": "A", "description": ""},
+            {"summary": "B", "description": ""}
+        ])
+        
+        self.assertEqual(results, [None, None])
+    
+    def test_not_configured(self):
+        """Test that nothing is posted without a base URL"""
+        self.client.base_url = None
+        
+        results = self.client.create_tickets_bulk([{"summary": "A", "description": ""}])
+        
+        self.assertEqual(results, [None])
+        self.client.session.post.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
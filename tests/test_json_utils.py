@@ -0,0 +1,52 @@
+"""
+Unit tests for JSON helpers
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+
+# Add parent directory to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils import json_utils
+
+class TestJsonUtils(unittest.TestCase):
+    
+    def test_non_ascii_written_as_is(self):
+        """Test that non-ASCII text is not escaped"""
+        self.assertIn("café ✅", json_utils.dumps({"summary": "café ✅"}))
+    
+    def test_non_str_keys(self):
+        """Test that int keys are accepted and become strings"""
+        self.assertEqual(json.loads(json_utils.dumps({1: "a"})), {"1": "a"})
+    
+    def test_pretty(self):
+        """Test two-space indentation"""
+        self.assertEqual(json_utils.dumps({"a": [1]}, pretty=True), json.dumps({"a": [1]}, indent=2))
+    
+    def test_bytes_round_trip(self):
+        """Test that encoded bytes parse back to the same object"""
+        payload = {"messages": [{"role": "user", "content": "hi"}]}
+        
+        encoded = json_utils.dumps_bytes(payload)
+        
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json_utils.loads(encoded), payload)
+    
+    def test_backends_agree_on_plain_data(self):
+        """Test that the stdlib fallback writes the same text as orjson"""
+        data = {"summary": "café", 1: [True, None, 2.5], "nested": {"key": "value"}}
+        
+        for pretty in (False, True):
+            with self.subTest(pretty=pretty):
+                default = json_utils.dumps(data, pretty)
+                with patch.object(json_utils, 'orjson', None):
+                    fallback = json_utils.dumps(data, pretty)
+                self.assertEqual(fallback, default)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Unit tests for monitoring utilities
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import tempfile
+import time
+import json
+import threading
+
+from botocore.exceptions import EndpointConnectionError
+
+# Add parent directory to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+monitoring = None
+
+def setUpModule():
+    """Import monitoring from a scratch directory so its logs/ folder lands there"""
+    global monitoring
+    log_dir = tempfile.TemporaryDirectory()
+    unittest.addModuleCleanup(log_dir.cleanup)
+    cwd = os.getcwd()
+    os.chdir(log_dir.name)
+    try:
+        from utils import monitoring
+    finally:
+        os.chdir(cwd)
+
+class TestKiroLogger(unittest.TestCase):
+    
+    @patch('utils.monitoring.st')
+    def test_log_user_action_accepts_non_str_keys(self, mock_st):
+        """Test that details keyed by ints are logged rather than raising"""
+        mock_st.session_state = {"session_id": "abc"}
+        
+        with patch.object(monitoring.logger.logger, 'info') as mock_info:
+            monitoring.logger.log_user_action("upload", {1: "café"})
+        
+        message = mock_info.call_args[0][0]
+        self.assertTrue(message.startswith("USER_ACTION: "))
+        self.assertEqual(json.loads(message[len("USER_ACTION: "):])["details"], {"1": "café"})
+
+class TestMetricsCollector(unittest.TestCase):
+    
+    def setUp(self):
+        with patch.object(monitoring.MetricsCollector, 'setup_cloudwatch'):
+            self.collector = monitoring.MetricsCollector()
+        self.collector.cloudwatch = MagicMock()
+    
+    def test_flush_survives_connection_error(self):
+        """Test that a BotoCoreError from one flush does not break the next"""
+        self.collector.cloudwatch.put_metric_data.side_effect = [
+            EndpointConnectionError(endpoint_url='https://monitoring.example'), None
+        ]
+        
+        self.collector.put_metric('Uploads', 1)
+        self.collector.flush()
+        self.collector.put_metric('Uploads', 2)
+        self.collector.flush()
+        
+        self.assertEqual(self.collector.cloudwatch.put_metric_data.call_count, 2)
+        self.assertEqual(self.collector._pending_metrics, [])
+    
+    def test_flusher_thread_survives_failed_flush(self):
+        """Test that the background flusher keeps running after a flush raises"""
+        calls = []
+        
+        def flush():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("flush failed")
+        
+        self.collector.flush = flush
+        with patch.object(monitoring, 'METRIC_FLUSH_INTERVAL', 0.01):
+            self.collector.put_metric('Uploads', 1)
+            deadline = time.monotonic() + 2
+            while len(calls) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        
+        self.assertGreaterEqual(len(calls), 2)
+        self.assertTrue(self.collector._flush_thread.is_alive())
+
+class TestPerformanceMonitor(unittest.TestCase):
+    
+    def setUp(self):
+        self.monitor = monitoring.PerformanceMonitor(metrics=MagicMock())
+    
+    def test_cpu_usage_is_none_until_first_sample(self):
+        """Test that no CPU metric is emitted before the sampler has a reading"""
+        first_sample = threading.Event()
+        never = threading.Event()
+        samples = []
+        
+        def cpu_percent(interval=None):
+            samples.append(interval)
+            if len(samples) == 1:
+                first_sample.wait(2)
+                return 12.5
+            never.wait()
+        
+        psutil = MagicMock()
+        psutil.cpu_percent.side_effect = cpu_percent
+        
+        with patch.dict(sys.modules, {'psutil': psutil}):
+            self.assertIsNone(self.monitor.monitor_cpu_usage())
+            self.monitor.metrics.put_metric.assert_not_called()
+            
+            first_sample.set()
+            deadline = time.monotonic() + 2
+            while self.monitor._cpu_percent is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            
+            self.assertEqual(self.monitor.monitor_cpu_usage(), 12.5)
+        
+        self.monitor.metrics.put_metric.assert_called_once_with(
+            metric_name='CPUUsage', value=12.5, unit='Percent'
+        )
+        self.assertEqual(samples[0], monitoring.CPU_SAMPLE_INTERVAL)
+
+if __name__ == '__main__':
+    unittest.main()
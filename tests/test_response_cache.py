@@ -0,0 +1,77 @@
+"""
+Unit tests for the AI response cache
+"""
+import unittest
+import sys
+import os
+import tempfile
+
+# Add parent directory to path for imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.response_cache import ResponseCache, ResponseCacheMiss
+
+class TestResponseCache(unittest.TestCase):
+    
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.cache_path = os.path.join(temp.name, "responses.sqlite3")
+        self.key = ResponseCache.make_key("model", 0.7, 4096, "prompt", "system")
+    
+    def test_make_key_covers_request(self):
+        """Test that every request parameter changes the key"""
+        variants = [
+            ("other-model", 0.7, 4096, "prompt", "system"),
+            ("model", 0.5, 4096, "prompt", "system"),
+            ("model", 0.7, 2048, "prompt", "system"),
+            ("model", 0.7, 4096, "other prompt", "system"),
+            ("model", 0.7, 4096, "prompt", None)
+        ]
+        
+        for variant in variants:
+            with self.subTest(variant=variant):
+                self.assertNotEqual(ResponseCache.make_key(*variant), self.key)
+    
+    def test_enabled_round_trip(self):
+        """Test that enabled mode stores and serves responses"""
+        cache = ResponseCache(self.cache_path, mode="enabled")
+        
+        self.assertIsNone(cache.get(self.key))
+        cache.put(self.key, "response")
+        
+        self.assertEqual(ResponseCache(self.cache_path, mode="enabled").get(self.key), "response")
+    
+    def test_readonly_does_not_store(self):
+        """Test that readonly mode never writes"""
+        cache = ResponseCache(self.cache_path, mode="readonly")
+        cache.put(self.key, "response")
+        
+        self.assertIsNone(cache.get(self.key))
+    
+    def test_replay_miss_raises(self):
+        """Test that replay mode refuses to fall through on a miss"""
+        ResponseCache(self.cache_path, mode="enabled").put(self.key, "response")
+        cache = ResponseCache(self.cache_path, mode="replay")
+        
+        self.assertEqual(cache.get(self.key), "response")
+        with self.assertRaises(ResponseCacheMiss):
+            cache.get(ResponseCache.make_key("model", 0.7, 4096, "unseen", None))
+    
+    def test_disabled_skips_storage(self):
+        """Test that disabled mode never touches the database"""
+        cache = ResponseCache(self.cache_path, mode="disabled")
+        cache.put(self.key, "response")
+        
+        self.assertIsNone(cache.get(self.key))
+        self.assertFalse(os.path.exists(self.cache_path))
+    
+    def test_unknown_mode_rejected(self):
+        """Test that an unknown mode is reported"""
+        with self.assertRaises(ValueError):
+            ResponseCache(self.cache_path, mode="sometimes")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,14 +7,20 @@ import sys
 import os
 
 # Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from engines.spec_engine import SpecEngine
+from services.ai_service import AIService
 
 class TestSpecEngine(unittest.TestCase):
     
-    def setUp(self):
-        self.spec_engine = SpecEngine()
+    @classmethod
+    def setUpClass(cls):
+        # SpecEngine keeps no per-document state and AIService does no I/O until
+        # a model is invoked, so one engine serves every test
+        cls.spec_engine = SpecEngine(AIService())
     
     def test_parse_requirements_format(self):
         """Test parsing of requirements in EARS format"""
@@ -2,12 +2,12 @@
 Comprehensive error handling for the Kiro Streamlit app
 """
 import streamlit as st
+import hashlib
 import logging
-import traceback
+import re
 from typing import Optional, Dict, Any, Callable
 from functools import wraps
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError, BotoCoreError
+from utils.health_cache import HealthCheckCache
 
 # Configure logging
 logging.basicConfig(
@@ -40,12 +40,65 @@ class ValidationError(KiroError):
     """Errors related to input validation"""
     pass
 
+# Bedrock ClientError codes -> (log label, user message); {message} is the AWS error message
+_AWS_ERROR_MESSAGES = {
+    'AccessDeniedException': (
+        "AWS access denied",
+        "Access denied to AWS Bedrock. Please check your IAM permissions."
+    ),
+    'ThrottlingException': (
+        "AWS throttling",
+        "AWS Bedrock is currently throttling requests. Please try again in a moment."
+    ),
+    'ValidationException': (
+        "AWS validation error",
+        "Invalid request to AWS Bedrock: {message}"
+    ),
+}
+
+# File errors -> (log message, user message, name shown when no path is given)
+_FILE_SYSTEM_ERROR_MESSAGES = {
+    PermissionError: (
+        "Permission denied accessing file: {file_path}",
+        "Permission denied accessing {name}. Please check file permissions.",
+        "the file"
+    ),
+    FileNotFoundError: (
+        "File not found: {file_path}",
+        "File not found: {name}",
+        "Unknown file"
+    ),
+    IsADirectoryError: (
+        "Expected file but got directory: {file_path}",
+        "Expected a file but found a directory: {name}",
+        None
+    ),
+    UnicodeDecodeError: (
+        "Unable to decode file: {file_path}",
+        "Unable to read file (encoding issue): {name}",
+        "Unknown file"
+    ),
+}
+
+# Keywords that classify JIRA errors, found in one case-insensitive scan
+_JIRA_ERROR_RE = re.compile(
+    r'(?P<auth>authentication|unauthorized)'
+    r'|(?P<connection>connection|network)'
+    r'|(?P<project>project)'
+    r'|(?P<not_found>not found)'
+    r'|(?P<rate_limit>rate limit|too many requests)',
+    re.IGNORECASE
+)
+
 class ErrorHandler:
     """Centralized error handling for the application"""
     
     @staticmethod
     def handle_aws_bedrock_error(error: Exception) -> str:
         """Handle AWS Bedrock specific errors"""
+        # botocore is imported on first use to keep it off the app's import path
+        from botocore.exceptions import ClientError, NoCredentialsError, BotoCoreError
+        
         if isinstance(error, NoCredentialsError):
             logger.error("AWS credentials not found")
             return "AWS credentials not configured. Please ensure your EC2 instance has the proper IAM role."
@@ -54,21 +107,14 @@ class ErrorHandler:
             error_code = error.response['Error']['Code']
             error_message = error.response['Error']['Message']
             
-            if error_code == 'AccessDeniedException':
-                logger.error(f"AWS access denied: {error_message}")
-                return "Access denied to AWS Bedrock. Please check your IAM permissions."
-            
-            elif error_code == 'ThrottlingException':
-                logger.error(f"AWS throttling: {error_message}")
-                return "AWS Bedrock is currently throttling requests. Please try again in a moment."
+            known = _AWS_ERROR_MESSAGES.get(error_code)
+            if known:
+                log_label, user_message = known
+                logger.error(f"{log_label}: {error_message}")
+                return user_message.format(message=error_message)
             
-            elif error_code == 'ValidationException':
-                logger.error(f"AWS validation error: {error_message}")
-                return f"Invalid request to AWS Bedrock: {error_message}"
-            
-            else:
-                logger.error(f"AWS Bedrock error {error_code}: {error_message}")
-                return f"AWS Bedrock error: {error_message}"
+            logger.error(f"AWS Bedrock error {error_code}: {error_message}")
+            return f"AWS Bedrock error: {error_message}"
         
         elif isinstance(error, BotoCoreError):
             logger.error(f"AWS connection error: {str(error)}")
@@ -81,54 +127,46 @@ class ErrorHandler:
     @staticmethod
     def handle_file_system_error(error: Exception, file_path: str = None) -> str:
         """Handle file system related errors"""
-        if isinstance(error, PermissionError):
-            logger.error(f"Permission denied accessing file: {file_path}")
-            return f"Permission denied accessing {'the file' if not file_path else file_path}. Please check file permissions."
-        
-        elif isinstance(error, FileNotFoundError):
-            logger.error(f"File not found: {file_path}")
-            return f"File not found: {'Unknown file' if not file_path else file_path}"
+        # Walk the MRO so subclasses of the listed exceptions still match
+        for error_type in type(error).__mro__:
+            known = _FILE_SYSTEM_ERROR_MESSAGES.get(error_type)
+            if known:
+                log_message, user_message, fallback_name = known
+                logger.error(log_message.format(file_path=file_path))
+                return user_message.format(name=file_path or fallback_name)
         
-        elif isinstance(error, IsADirectoryError):
-            logger.error(f"Expected file but got directory: {file_path}")
-            return f"Expected a file but found a directory: {file_path}"
-        
-        elif isinstance(error, OSError) and "File name too long" in str(error):
+        if isinstance(error, OSError) and "File name too long" in str(error):
             logger.error(f"File name too long: {file_path}")
             return "File name is too long. Please use shorter file names."
         
-        elif isinstance(error, UnicodeDecodeError):
-            logger.error(f"Unable to decode file: {file_path}")
-            return f"Unable to read file (encoding issue): {'Unknown file' if not file_path else file_path}"
-        
-        else:
-            logger.error(f"File system error: {str(error)}")
-            return f"File system error: {str(error)}"
+        logger.error(f"File system error: {str(error)}")
+        return f"File system error: {str(error)}"
     
     @staticmethod
     def handle_jira_error(error: Exception) -> str:
         """Handle JIRA integration errors"""
-        error_str = str(error).lower()
+        error_str = str(error)
+        found = {match.lastgroup for match in _JIRA_ERROR_RE.finditer(error_str)}
         
-        if "authentication" in error_str or "unauthorized" in error_str:
+        if "auth" in found:
             logger.error("JIRA authentication failed")
             return "JIRA authentication failed. Please check your credentials and permissions."
         
-        elif "connection" in error_str or "network" in error_str:
+        elif "connection" in found:
             logger.error("JIRA connection failed")
             return "Unable to connect to JIRA. Please check your network connection and JIRA URL."
         
-        elif "project" in error_str and "not found" in error_str:
+        elif "project" in found and "not_found" in found:
             logger.error("JIRA project not found")
             return "JIRA project not found. Please verify the project key is correct."
         
-        elif "rate limit" in error_str or "too many requests" in error_str:
+        elif "rate_limit" in found:
             logger.error("JIRA rate limit exceeded")
             return "JIRA rate limit exceeded. Please wait a moment before trying again."
         
         else:
-            logger.error(f"JIRA integration error: {str(error)}")
-            return f"JIRA integration error: {str(error)}"
+            logger.error(f"JIRA integration error: {error_str}")
+            return f"JIRA integration error: {error_str}"
     
     @staticmethod
     def validate_input(value: Any, validation_type: str, **kwargs) -> bool:
@@ -167,6 +205,8 @@ class ErrorHandler:
 
 def error_boundary(error_message: str = "An error occurred"):
     """Decorator for handling errors in Streamlit functions"""
+    unexpected_prefix = f"🚨 {error_message}: "
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -177,11 +217,11 @@ def error_boundary(error_message: str = "An error occurred"):
                 if e.details:
                     with st.expander("Error Details"):
                         st.json(e.details)
-                logger.error(f"KiroError in {func.__name__}: {e.message}")
+                logger.error("KiroError in %s: %s", func.__name__, e.message)
             except Exception as e:
-                st.error(f"🚨 {error_message}: {str(e)}")
-                logger.error(f"Unexpected error in {func.__name__}: {str(e)}")
-                logger.error(traceback.format_exc())
+                st.error(unexpected_prefix + str(e))
+                # exc_info defers traceback formatting to handlers that emit the record
+                logger.error("Unexpected error in %s: %s", func.__name__, e, exc_info=True)
         return wrapper
     return decorator
 
@@ -192,7 +232,9 @@ def display_error_with_retry(error_message: str, retry_callback: Callable = None
     if retry_callback:
         col1, col2, col3 = st.columns([1, 1, 2])
         with col2:
-            if st.button("🔄 Retry", key=f"retry_{hash(error_message)}"):
+            # hash() is salted per process; a digest keeps the widget key stable
+            key = "retry_" + hashlib.blake2s(error_message.encode("utf-8"), digest_size=8).hexdigest()
+            if st.button("🔄 Retry", key=key):
                 retry_callback()
 
 def log_user_action(action: str, details: Dict[str, Any] = None):
@@ -208,12 +250,22 @@ def log_user_action(action: str, details: Dict[str, Any] = None):
 class HealthChecker:
     """Check system health and dependencies"""
     
+    # Shared by every caller, since all checks are static
+    _check_cache = HealthCheckCache()
+    
     @staticmethod
     def check_aws_connection() -> Dict[str, Any]:
-        """Check AWS Bedrock connectivity"""
+        """Check AWS Bedrock connectivity, reusing a result younger than HEALTH_CHECK_TTL"""
+        return HealthChecker._check_cache.get_or_run("aws", HealthChecker._probe_aws_connection)
+    
+    @staticmethod
+    def _probe_aws_connection() -> Dict[str, Any]:
+        """Query AWS Bedrock for a fresh connectivity result"""
         try:
+            import boto3
             session = boto3.Session()
-            bedrock = session.client('bedrock-runtime')
+            # Model listing lives on the control-plane client, not bedrock-runtime
+            bedrock = session.client('bedrock')
             # Simple check - list available models
             response = bedrock.list_foundation_models()
             return {"status": "healthy", "details": "AWS Bedrock accessible"}
@@ -221,8 +273,8 @@ class HealthChecker:
             return {"status": "unhealthy", "error": str(e)}
     
     @staticmethod
-    def check_file_system() -> Dict[str, Any]:
-        """Check file system access"""
+    def check_file_system(durability: bool = False) -> Dict[str, Any]:
+        """Check file system access; durability=True also forces the write to disk"""
         try:
             import tempfile
             import os
@@ -231,7 +283,8 @@ class HealthChecker:
             with tempfile.NamedTemporaryFile(delete=True) as tmp:
                 tmp.write(b"test")
                 tmp.flush()
-                os.fsync(tmp.fileno())
+                if durability:
+                    os.fsync(tmp.fileno())
             
             return {"status": "healthy", "details": "File system accessible"}
         except Exception as e:
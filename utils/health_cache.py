@@ -0,0 +1,27 @@
+"""
+Short-lived cache of health check results for the Kiro Streamlit app
+"""
+import time
+from typing import Any, Callable, Dict
+
+# Seconds a health check result is reused; Streamlit reruns on every widget
+# interaction and most checks are a network round trip
+HEALTH_CHECK_TTL = 30
+
+class HealthCheckCache:
+    """Health check results keyed by check name, each reused for HEALTH_CHECK_TTL seconds"""
+    
+    def __init__(self):
+        # Check name -> (monotonic time, result)
+        self._results = {}
+    
+    def get_or_run(self, name: str, check: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return a copy of the cached result for name, running check when it is stale"""
+        now = time.monotonic()
+        cached = self._results.get(name)
+        if cached and now - cached[0] < HEALTH_CHECK_TTL:
+            return dict(cached[1])
+        
+        result = check()
+        self._results[name] = (now, result)
+        return dict(result)
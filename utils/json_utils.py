@@ -0,0 +1,39 @@
+"""
+JSON helpers for the Kiro Streamlit app
+"""
+import json
+from typing import Any
+
+# orjson is optional; when installed it is used for every encode and decode.
+# For plain JSON data (dicts, lists, strings, numbers, booleans, None) both
+# paths write the same text: compact or two-space indented, non-ASCII as-is,
+# non-string dict keys converted to strings. orjson also serializes values
+# json rejects with TypeError, such as datetime, UUID and dataclasses.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize obj to a JSON string, indented by two spaces when pretty"""
+    return dumps_bytes(obj, pretty).decode("utf-8")
+
+def dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+def loads(data) -> Any:
+    """Parse JSON from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
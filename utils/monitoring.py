@@ -2,15 +2,22 @@
 Monitoring and logging utilities for the Kiro Streamlit app
 """
 import logging
+import logging.handlers
+import queue
 import time
-import json
 import os
+import atexit
+import threading
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 import streamlit as st
-from functools import wraps
-import boto3
-from botocore.exceptions import ClientError
+from functools import wraps, lru_cache
+from utils import json_utils
+from utils.health_cache import HealthCheckCache
+
+# Each log file rotates at this size, keeping this many old copies
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
 
 class KiroLogger:
     """Enhanced logging for the Kiro application"""
@@ -39,7 +46,9 @@ class KiroLogger:
             )
             
             # File handler for detailed logs
-            file_handler = logging.FileHandler("logs/app.log")
+            file_handler = logging.handlers.RotatingFileHandler(
+                "logs/app.log", maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT
+            )
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(detailed_formatter)
             
@@ -49,27 +58,40 @@ class KiroLogger:
             console_handler.setFormatter(simple_formatter)
             
             # Error file handler
-            error_handler = logging.FileHandler("logs/error.log")
+            error_handler = logging.handlers.RotatingFileHandler(
+                "logs/error.log", maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT
+            )
             error_handler.setLevel(logging.ERROR)
             error_handler.setFormatter(detailed_formatter)
             
-            # Add handlers
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(console_handler)
-            self.logger.addHandler(error_handler)
+            # Callers only enqueue records; a listener thread does the writes
+            log_queue = queue.Queue(-1)
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            self._listener = logging.handlers.QueueListener(
+                log_queue, file_handler, console_handler, error_handler,
+                respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self._listener.stop)
     
     def log_user_action(self, action: str, details: Dict[str, Any] = None):
         """Log user actions with context"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         log_data = {
             "action": action,
             "session_id": st.session_state.get("session_id", "unknown"),
             "timestamp": datetime.now().isoformat(),
             "details": details or {}
         }
-        self.logger.info(f"USER_ACTION: {json.dumps(log_data)}")
+        self.logger.info(f"USER_ACTION: {json_utils.dumps(log_data)}")
     
     def log_ai_interaction(self, model: str, prompt_length: int, response_length: int, duration: float):
         """Log AI model interactions"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         log_data = {
             "model": model,
             "prompt_length": prompt_length,
@@ -77,27 +99,47 @@ class KiroLogger:
             "duration_seconds": duration,
             "timestamp": datetime.now().isoformat()
         }
-        self.logger.info(f"AI_INTERACTION: {json.dumps(log_data)}")
+        self.logger.info(f"AI_INTERACTION: {json_utils.dumps(log_data)}")
     
     def log_error(self, error: Exception, context: Dict[str, Any] = None):
         """Log errors with context"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
         log_data = {
             "error_type": type(error).__name__,
             "error_message": str(error),
             "context": context or {},
             "timestamp": datetime.now().isoformat()
         }
-        self.logger.error(f"ERROR: {json.dumps(log_data)}", exc_info=True)
+        self.logger.error(f"ERROR: {json_utils.dumps(log_data)}", exc_info=True)
     
     def log_performance(self, operation: str, duration: float, details: Dict[str, Any] = None):
         """Log performance metrics"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         log_data = {
             "operation": operation,
             "duration_seconds": duration,
             "details": details or {},
             "timestamp": datetime.now().isoformat()
         }
-        self.logger.info(f"PERFORMANCE: {json.dumps(log_data)}")
+        self.logger.info(f"PERFORMANCE: {json_utils.dumps(log_data)}")
+
+# CloudWatch accepts up to 1000 datums in one PutMetricData call
+METRIC_BATCH_SIZE = 1000
+
+# Seconds between background flushes of buffered metrics
+METRIC_FLUSH_INTERVAL = 5
+
+# Metrics queued beyond this while CloudWatch is slow or throttling are dropped
+METRIC_BUFFER_LIMIT = 10000
+
+@lru_cache(maxsize=1024)
+def _format_dimensions(items: tuple) -> list:
+    """CloudWatch Dimensions list for sorted (name, value) pairs; shared, never mutated"""
+    return [{'Name': k, 'Value': v} for k, v in items]
 
 class MetricsCollector:
     """Collect and send metrics to CloudWatch"""
@@ -105,40 +147,86 @@ class MetricsCollector:
     def __init__(self):
         self.cloudwatch = None
         self.namespace = "KiroApp"
+        self._pending_metrics = []
+        self._pending_lock = threading.Lock()
+        self._flush_thread = None
+        self.dropped_metrics = 0
         self.setup_cloudwatch()
     
     def setup_cloudwatch(self):
         """Set up CloudWatch client"""
         try:
+            # boto3 is imported on first use to keep it off the app's import path
+            import boto3
             session = boto3.Session()
             self.cloudwatch = session.client('cloudwatch')
         except Exception as e:
-            logger.error(f"Failed to setup CloudWatch: {e}")
+            logger.logger.error(f"Failed to setup CloudWatch: {e}")
     
     def put_metric(self, metric_name: str, value: float, unit: str = 'Count', dimensions: Dict[str, str] = None):
-        """Send metric to CloudWatch"""
+        """Queue a metric for the next batched send to CloudWatch"""
         if not self.cloudwatch:
             return
         
-        try:
-            metric_data = {
-                'MetricName': metric_name,
-                'Value': value,
-                'Unit': unit,
+        # The timestamp is taken now so delayed batches still report when it happened
+        metric_data = {
+            'MetricName': metric_name,
+            'Value': value,
+            'Unit': unit,
+            'Timestamp': datetime.utcnow()
+        }
+        
+        if dimensions:
+            metric_data['Dimensions'] = _format_dimensions(tuple(sorted(dimensions.items())))
+        
+        with self._pending_lock:
+            if len(self._pending_metrics) >= METRIC_BUFFER_LIMIT:
+                self.dropped_metrics += 1
+                return
+            self._pending_metrics.append(metric_data)
+            if self._flush_thread is None:
+                self._start_flusher()
+    
+    def flush(self):
+        """Send every queued metric in as few PutMetricData calls as possible"""
+        with self._pending_lock:
+            pending, self._pending_metrics = self._pending_metrics, []
+            dropped, self.dropped_metrics = self.dropped_metrics, 0
+        
+        if dropped:
+            pending.append({
+                'MetricName': 'DroppedMetrics',
+                'Value': dropped,
+                'Unit': 'Count',
                 'Timestamp': datetime.utcnow()
-            }
-            
-            if dimensions:
-                metric_data['Dimensions'] = [
-                    {'Name': k, 'Value': v} for k, v in dimensions.items()
-                ]
-            
-            self.cloudwatch.put_metric_data(
-                Namespace=self.namespace,
-                MetricData=[metric_data]
-            )
-        except ClientError as e:
-            logger.error(f"Failed to send metric to CloudWatch: {e}")
+            })
+        
+        for start in range(0, len(pending), METRIC_BATCH_SIZE):
+            try:
+                self.cloudwatch.put_metric_data(
+                    Namespace=self.namespace,
+                    MetricData=pending[start:start + METRIC_BATCH_SIZE]
+                )
+            except Exception as e:
+                # Connection and credential failures are BotoCoreErrors, not ClientErrors
+                logger.logger.error(f"Failed to send metrics to CloudWatch: {e}")
+    
+    def _start_flusher(self):
+        """Flush in the background, and once more at interpreter exit"""
+        def flush_periodically():
+            while True:
+                time.sleep(METRIC_FLUSH_INTERVAL)
+                try:
+                    self.flush()
+                except Exception as e:
+                    # Keep the thread alive; a dead flusher is never restarted
+                    logger.logger.error(f"Metrics flush failed: {e}")
+        
+        self._flush_thread = threading.Thread(
+            target=flush_periodically, name="cloudwatch-metrics", daemon=True
+        )
+        self._flush_thread.start()
+        atexit.register(self.flush)
     
     def record_user_action(self, action: str):
         """Record user action metric"""
@@ -184,26 +272,25 @@ class MetricsCollector:
             unit='Bytes'
         )
 
+# Seconds each background CPU sample covers
+CPU_SAMPLE_INTERVAL = 5
+
 class PerformanceMonitor:
     """Monitor application performance"""
     
-    def __init__(self):
-        self.start_times = {}
-        self.metrics = MetricsCollector()
+    def __init__(self, metrics: Optional[MetricsCollector] = None):
+        self.metrics = metrics or MetricsCollector()
+        self._cpu_percent = None
+        self._cpu_sampler = None
+        self._cpu_sampler_lock = threading.Lock()
     
-    def start_timer(self, operation: str) -> str:
-        """Start timing an operation"""
-        timer_id = f"{operation}_{int(time.time() * 1000)}"
-        self.start_times[timer_id] = time.time()
-        return timer_id
+    def start_timer(self, operation: str = None) -> int:
+        """Start timing an operation; the monotonic start time is the timer id"""
+        return time.perf_counter_ns()
     
-    def end_timer(self, timer_id: str, operation: str = None) -> float:
-        """End timing and record duration"""
-        if timer_id not in self.start_times:
-            return 0.0
-        
-        duration = time.time() - self.start_times[timer_id]
-        del self.start_times[timer_id]
+    def end_timer(self, start_ns: int, operation: str = None) -> float:
+        """End timing and record duration in seconds"""
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         
         if operation:
             logger.log_performance(operation, duration)
@@ -235,41 +322,60 @@ class PerformanceMonitor:
                 'percent': process.memory_percent()
             }
         except ImportError:
-            logger.warning("psutil not available for memory monitoring")
+            logger.logger.warning("psutil not available for memory monitoring")
             return None
     
     def monitor_cpu_usage(self):
-        """Monitor CPU usage"""
+        """Monitor CPU usage using the latest background sample"""
         try:
             import psutil
-            cpu_percent = psutil.cpu_percent(interval=1)
-            
-            self.metrics.put_metric(
-                metric_name='CPUUsage',
-                value=cpu_percent,
-                unit='Percent'
-            )
-            
-            return cpu_percent
         except ImportError:
-            logger.warning("psutil not available for CPU monitoring")
+            logger.logger.warning("psutil not available for CPU monitoring")
             return None
+        
+        with self._cpu_sampler_lock:
+            if self._cpu_sampler is None:
+                self._start_cpu_sampler(psutil)
+        
+        # None until the sampler finishes its first interval
+        cpu_percent = self._cpu_percent
+        if cpu_percent is None:
+            return None
+        
+        self.metrics.put_metric(
+            metric_name='CPUUsage',
+            value=cpu_percent,
+            unit='Percent'
+        )
+        
+        return cpu_percent
+    
+    def _start_cpu_sampler(self, psutil):
+        """Sample CPU in a daemon thread so callers never wait on the interval"""
+        def sample_periodically():
+            while True:
+                self._cpu_percent = psutil.cpu_percent(interval=CPU_SAMPLE_INTERVAL)
+        
+        self._cpu_sampler = threading.Thread(
+            target=sample_periodically, name="cpu-sampler", daemon=True
+        )
+        self._cpu_sampler.start()
 
 def performance_monitor(operation_name: str):
     """Decorator to monitor function performance"""
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            monitor = PerformanceMonitor()
-            timer_id = monitor.start_timer(operation_name)
+            monitor = performance_monitor_instance
+            start_ns = monitor.start_timer(operation_name)
             
             try:
                 result = func(*args, **kwargs)
-                duration = monitor.end_timer(timer_id, operation_name)
+                duration = monitor.end_timer(start_ns, operation_name)
                 logger.log_performance(operation_name, duration, {"success": True})
                 return result
             except Exception as e:
-                duration = monitor.end_timer(timer_id, operation_name)
+                duration = monitor.end_timer(start_ns, operation_name)
                 logger.log_performance(operation_name, duration, {"success": False, "error": str(e)})
                 raise
         
@@ -279,14 +385,22 @@ def performance_monitor(operation_name: str):
 class HealthChecker:
     """Application health monitoring"""
     
-    def __init__(self):
-        self.metrics = MetricsCollector()
+    def __init__(self, metrics: Optional[MetricsCollector] = None):
+        self.metrics = metrics or MetricsCollector()
+        # Probes also emit CloudWatch metrics, so those are throttled with them
+        self._check_cache = HealthCheckCache()
     
     def check_aws_connectivity(self) -> Dict[str, Any]:
         """Check AWS services connectivity"""
+        return self._check_cache.get_or_run("aws", self._probe_aws_connectivity)
+    
+    def _probe_aws_connectivity(self) -> Dict[str, Any]:
+        """Query AWS services and record the connectivity metric"""
         try:
+            import boto3
             session = boto3.Session()
-            bedrock = session.client('bedrock-runtime')
+            # Model listing lives on the control-plane client, not bedrock-runtime
+            bedrock = session.client('bedrock')
             bedrock.list_foundation_models()
             
             self.metrics.put_metric('AWSConnectivity', 1, dimensions={'Service': 'Bedrock'})
@@ -297,6 +411,10 @@ class HealthChecker:
     
     def check_disk_space(self) -> Dict[str, Any]:
         """Check available disk space"""
+        return self._check_cache.get_or_run("disk", self._probe_disk_space)
+    
+    def _probe_disk_space(self) -> Dict[str, Any]:
+        """Measure disk space and record the free-space metric"""
         try:
             import shutil
             total, used, free = shutil.disk_usage("/")
@@ -343,8 +461,8 @@ class HealthChecker:
 # Global instances
 logger = KiroLogger()
 metrics = MetricsCollector()
-performance_monitor_instance = PerformanceMonitor()
-health_checker = HealthChecker()
+performance_monitor_instance = PerformanceMonitor(metrics)
+health_checker = HealthChecker(metrics)
 
 def setup_monitoring():
     """Initialize monitoring for the application"""
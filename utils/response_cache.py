@@ -0,0 +1,82 @@
+"""
+On-disk cache of AI model responses for the Kiro Streamlit app
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+# disabled: never read or write (default)
+# enabled:  serve cached responses and store new ones
+# readonly: serve cached responses, never store
+# replay:   serve cached responses, raise ResponseCacheMiss on a miss
+CACHE_MODES = ("disabled", "enabled", "readonly", "replay")
+
+DEFAULT_CACHE_PATH = os.path.join("cache", "ai_responses.sqlite3")
+
+class ResponseCacheMiss(LookupError):
+    """Raised in replay mode when a request has no cached response"""
+    pass
+
+class ResponseCache:
+    """SQLite-backed store of model responses keyed by a SHA-256 of the request"""
+    
+    def __init__(self, path: str = None, mode: str = None):
+        self.mode = (mode or os.getenv("KIRO_CACHE_MODE", "disabled")).lower()
+        if self.mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode '{self.mode}'. Expected one of: {', '.join(CACHE_MODES)}")
+        
+        self.path = path or os.getenv("KIRO_CACHE_PATH", DEFAULT_CACHE_PATH)
+        self._connection = None
+        self._lock = threading.Lock()
+    
+    @property
+    def active(self) -> bool:
+        """Whether lookups should be attempted at all"""
+        return self.mode != "disabled"
+    
+    @staticmethod
+    def make_key(model_id: str, temperature: float, max_tokens: int,
+                 prompt: str, system_prompt: str = None) -> str:
+        """Hash everything that determines a model response"""
+        request = json.dumps([model_id, temperature, max_tokens, system_prompt, prompt])
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss"""
+        if not self.active:
+            return None
+        
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT response FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        
+        if row is None and self.mode == "replay":
+            raise ResponseCacheMiss(f"No cached response for request {key[:12]} in replay mode")
+        
+        return row[0] if row else None
+    
+    def put(self, key: str, response: str):
+        """Store a response when the cache is writable"""
+        if self.mode != "enabled":
+            return
+        
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)", (key, response)
+            )
+            connection.commit()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use; Streamlit reruns share it across threads"""
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+        return self._connection
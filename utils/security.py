@@ -3,22 +3,51 @@ Security utilities for the Kiro Streamlit app
 """
 import os
 import re
+import stat
+import time
+import logging
 import hashlib
 import secrets
+from collections import deque
 from typing import List, Dict, Any, Optional
 import streamlit as st
-from pathlib import Path
 import mimetypes
 
+# Security events kept in the session for admin review; older ones are dropped
+MAX_SECURITY_EVENTS = 500
+
+# Every ASCII character, used to build str.translate deletion tables
+_ASCII_CHARS = ''.join(map(chr, range(128)))
+
+# MIME types (by prefix) accepted for uploads
+_TEXT_MIME_PREFIXES = ('text/', 'application/json', 'application/xml')
+
+# Matching forms of SecurityValidator.DANGEROUS_PATTERNS entries. Runs that the
+# next token can never match are possessive so a failed attempt does not
+# backtrack through them; warnings still show the pattern as listed
+_POSSESSIVE_PATTERNS = {
+    r'<script[^>]*>.*?</script>': r'<script[^>]*+>.*?</script>',
+    r'on\w+\s*=': r'on\w++\s*+='
+}
+
 class SecurityValidator:
     """Security validation and protection utilities"""
     
     # Allowed file extensions for upload
-    ALLOWED_EXTENSIONS = {
+    ALLOWED_EXTENSIONS = frozenset({
         '.txt', '.md', '.py', '.js', '.ts', '.jsx', '.tsx', '.json', '.yaml', '.yml',
         '.xml', '.html', '.css', '.scss', '.sass', '.sql', '.sh', '.bat', '.ps1',
         '.java', '.cpp', '.c', '.h', '.hpp', '.cs', '.php', '.rb', '.go', '.rs',
         '.swift', '.kt', '.scala', '.clj', '.hs', '.ml', '.r', '.m', '.pl', '.lua'
+    })
+    _ALLOWED_EXTENSIONS_TEXT = ', '.join(sorted(ALLOWED_EXTENSIONS))
+    
+    # The MIME guess depends only on the extension, so allowed extensions whose
+    # guessed type is not text are resolved once here
+    _REJECTED_MIME_TYPES = {
+        ext: mime_type
+        for ext, mime_type in ((ext, mimetypes.guess_type('file' + ext)[0]) for ext in ALLOWED_EXTENSIONS)
+        if mime_type and not mime_type.startswith(_TEXT_MIME_PREFIXES)
     }
     
     # Maximum file size (10MB)
@@ -42,6 +71,29 @@ class SecurityValidator:
         r'passthru\s*\(',             # Passthru (PHP)
     ]
     
+    # Compiled once as (label, regex) pairs; the combined alternation removes
+    # every pattern in one pass and pre-screens content before the warning checks
+    _DANGEROUS_RES = tuple(
+        (pattern, re.compile(_POSSESSIVE_PATTERNS.get(pattern, pattern), re.IGNORECASE))
+        for pattern in DANGEROUS_PATTERNS
+    )
+    _ANY_DANGEROUS_RE = re.compile(
+        '|'.join(f'(?:{regex.pattern})' for _, regex in _DANGEROUS_RES), re.IGNORECASE
+    )
+    
+    # Suspicious imports/calls flagged in file content (case-insensitive)
+    SUSPICIOUS_IMPORTS = (
+        'import subprocess', 'import os', 'import sys', 'from os import',
+        '#include <windows.h>', '#include <unistd.h>', 'require("child_process")',
+        'eval(', 'exec(', 'system(', 'shell_exec(', 'passthru('
+    )
+    
+    # All needles in one case-insensitive scan; the lookahead lets overlapping
+    # hits (exec( inside shell_exec() each be reported
+    _SUSPICIOUS_IMPORT_RE = re.compile(
+        '(?=(' + '|'.join(re.escape(imp) for imp in SUSPICIOUS_IMPORTS) + '))', re.IGNORECASE
+    )
+    
     @classmethod
     def validate_file_upload(cls, uploaded_file) -> Dict[str, Any]:
         """Validate uploaded file for security"""
@@ -56,16 +108,16 @@ class SecurityValidator:
             }
         
         # Check file extension
-        file_ext = Path(uploaded_file.name).suffix.lower()
+        file_ext = os.path.splitext(uploaded_file.name)[1].lower()
         if file_ext not in cls.ALLOWED_EXTENSIONS:
             return {
                 "valid": False,
-                "error": f"File type '{file_ext}' not allowed. Allowed types: {', '.join(sorted(cls.ALLOWED_EXTENSIONS))}"
+                "error": f"File type '{file_ext}' not allowed. Allowed types: {cls._ALLOWED_EXTENSIONS_TEXT}"
             }
         
         # Check MIME type
-        mime_type, _ = mimetypes.guess_type(uploaded_file.name)
-        if mime_type and not mime_type.startswith(('text/', 'application/json', 'application/xml')):
+        mime_type = cls._REJECTED_MIME_TYPES.get(file_ext)
+        if mime_type:
             return {
                 "valid": False,
                 "error": f"MIME type '{mime_type}' not allowed. Only text files are permitted."
@@ -86,15 +138,18 @@ class SecurityValidator:
         except Exception as e:
             return {"valid": False, "error": f"Invalid path: {str(e)}"}
         
-        # Check for directory traversal attempts
-        if '..' in normalized_path or normalized_path.startswith('/'):
+        # Check for directory traversal attempts; normpath leaves '..' only as
+        # whole leading components, so names like 'my..folder' stay allowed
+        if '..' in normalized_path.split(os.sep) or os.path.isabs(normalized_path):
             return {"valid": False, "error": "Directory traversal not allowed"}
         
-        # Check if path exists and is a directory
-        if not os.path.exists(resolved_path):
+        # Check if path exists and is a directory, with a single stat call
+        try:
+            path_mode = os.stat(resolved_path).st_mode
+        except OSError:
             return {"valid": False, "error": f"Path does not exist: {folder_path}"}
         
-        if not os.path.isdir(resolved_path):
+        if not stat.S_ISDIR(path_mode):
             return {"valid": False, "error": f"Path is not a directory: {folder_path}"}
         
         # Check read permissions
@@ -117,8 +172,7 @@ class SecurityValidator:
             sanitized = sanitized[:10000]
         
         # Remove potentially dangerous patterns
-        for pattern in cls.DANGEROUS_PATTERNS:
-            sanitized = re.sub(pattern, '[REMOVED]', sanitized, flags=re.IGNORECASE)
+        sanitized = cls._ANY_DANGEROUS_RE.sub('[REMOVED]', sanitized)
         
         return sanitized
     
@@ -128,31 +182,31 @@ class SecurityValidator:
         if not content:
             return {"valid": True, "warnings": []}
         
+        # Check file size first so oversized content skips the scans below.
+        # UTF-8 uses at most 4 bytes per character, so only content near the
+        # limit is measured, and ASCII content is measured without encoding
+        if len(content) * 4 > cls.MAX_FILE_SIZE:
+            content_size = len(content) if content.isascii() else len(content.encode('utf-8'))
+            if content_size > cls.MAX_FILE_SIZE:
+                return {
+                    "valid": False,
+                    "error": f"File content too large ({content_size / (1024*1024):.1f}MB)"
+                }
+        
         warnings = []
         
         # Check for dangerous patterns
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, content, re.IGNORECASE):
-                warnings.append(f"Potentially dangerous pattern detected: {pattern}")
+        if cls._ANY_DANGEROUS_RE.search(content):
+            for label, regex in cls._DANGEROUS_RES:
+                if regex.search(content):
+                    warnings.append(f"Potentially dangerous pattern detected: {label}")
         
         # Check for suspicious imports/includes
-        suspicious_imports = [
-            'import subprocess', 'import os', 'import sys', 'from os import',
-            '#include <windows.h>', '#include <unistd.h>', 'require("child_process")',
-            'eval(', 'exec(', 'system(', 'shell_exec(', 'passthru('
-        ]
-        
-        for imp in suspicious_imports:
-            if imp.lower() in content.lower():
+        found = {match.group(1).lower() for match in cls._SUSPICIOUS_IMPORT_RE.finditer(content)}
+        for imp in cls.SUSPICIOUS_IMPORTS:
+            if imp.lower() in found:
                 warnings.append(f"Suspicious import/call detected: {imp}")
         
-        # Check file size
-        if len(content.encode('utf-8')) > cls.MAX_FILE_SIZE:
-            return {
-                "valid": False,
-                "error": f"File content too large ({len(content.encode('utf-8')) / (1024*1024):.1f}MB)"
-            }
-        
         return {"valid": True, "warnings": warnings}
     
     @classmethod
@@ -163,7 +217,8 @@ class SecurityValidator:
     @classmethod
     def hash_sensitive_data(cls, data: str) -> str:
         """Hash sensitive data for logging"""
-        return hashlib.sha256(data.encode()).hexdigest()[:16]
+        # An 8-byte BLAKE2b digest gives the same 16 hex chars as truncated SHA-256
+        return hashlib.blake2b(data.encode('utf-8'), digest_size=8).hexdigest()
 
 class SessionManager:
     """Manage secure sessions"""
@@ -185,8 +240,6 @@ class SessionManager:
     @staticmethod
     def check_rate_limit() -> bool:
         """Check if user is within rate limits"""
-        import time
-        
         context = st.session_state.security_context
         current_time = time.time()
         
@@ -212,8 +265,6 @@ class SessionManager:
     @staticmethod
     def record_upload(file_size: int):
         """Record file upload for rate limiting"""
-        import time
-        
         context = st.session_state.security_context
         context["upload_count"] += 1
         context["total_upload_size"] += file_size
@@ -222,8 +273,28 @@ class SessionManager:
 class InputSanitizer:
     """Sanitize various types of user input"""
     
-    @staticmethod
-    def sanitize_jira_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    # Compiled once at class load instead of looked up in re's cache per call
+    _USERNAME_DISALLOWED_RE = re.compile(r'[^\w@.-]')
+    _PROJECT_KEY_DISALLOWED_RE = re.compile(r'[^\w-]')
+    _WHITESPACE_RUN_RE = re.compile(r'\s+')
+    
+    # Same filters as str.translate tables for the common all-ASCII input;
+    # the regexes still handle non-ASCII since \w is Unicode-aware
+    _USERNAME_ASCII_TABLE = str.maketrans('', '', ''.join(_USERNAME_DISALLOWED_RE.findall(_ASCII_CHARS)))
+    _PROJECT_KEY_ASCII_TABLE = str.maketrans('', '', ''.join(_PROJECT_KEY_DISALLOWED_RE.findall(_ASCII_CHARS)))
+    
+    # Prompt injection phrases, joined into one case-insensitive pass
+    _PROMPT_INJECTION_RE = re.compile(
+        r'ignore\s+previous\s+instructions'
+        r'|forget\s+everything'
+        r'|act\s+as\s+if'
+        r'|pretend\s+to\s+be'
+        r'|roleplay\s+as',
+        re.IGNORECASE
+    )
+    
+    @classmethod
+    def sanitize_jira_config(cls, config: Dict[str, Any]) -> Dict[str, Any]:
         """Sanitize JIRA configuration input"""
         sanitized = {}
         
@@ -236,31 +307,30 @@ class InputSanitizer:
         
         # Username sanitization
         if "username" in config:
-            sanitized["username"] = re.sub(r'[^\w@.-]', '', config["username"])
+            username = config["username"]
+            if username.isascii():
+                sanitized["username"] = username.translate(cls._USERNAME_ASCII_TABLE)
+            else:
+                sanitized["username"] = cls._USERNAME_DISALLOWED_RE.sub('', username)
         
         # Project key sanitization
         if "project_key" in config:
-            sanitized["project_key"] = re.sub(r'[^\w-]', '', config["project_key"])
+            project_key = config["project_key"]
+            if project_key.isascii():
+                sanitized["project_key"] = project_key.translate(cls._PROJECT_KEY_ASCII_TABLE)
+            else:
+                sanitized["project_key"] = cls._PROJECT_KEY_DISALLOWED_RE.sub('', project_key)
         
         return sanitized
     
-    @staticmethod
-    def sanitize_ai_prompt(prompt: str) -> str:
+    @classmethod
+    def sanitize_ai_prompt(cls, prompt: str) -> str:
         """Sanitize AI prompts"""
         # Remove excessive whitespace
-        prompt = re.sub(r'\s+', ' ', prompt.strip())
+        prompt = cls._WHITESPACE_RUN_RE.sub(' ', prompt.strip())
         
         # Remove potential prompt injection attempts
-        injection_patterns = [
-            r'ignore\s+previous\s+instructions',
-            r'forget\s+everything',
-            r'act\s+as\s+if',
-            r'pretend\s+to\s+be',
-            r'roleplay\s+as'
-        ]
-        
-        for pattern in injection_patterns:
-            prompt = re.sub(pattern, '[FILTERED]', prompt, flags=re.IGNORECASE)
+        prompt = cls._PROMPT_INJECTION_RE.sub('[FILTERED]', prompt)
         
         return prompt[:5000]  # Limit length
 
@@ -275,8 +345,6 @@ def require_authentication(func):
 
 def log_security_event(event_type: str, details: Dict[str, Any]):
     """Log security events for monitoring"""
-    import logging
-    
     logger = logging.getLogger("security")
     
     event_data = {
@@ -286,10 +354,10 @@ def log_security_event(event_type: str, details: Dict[str, Any]):
         "details": details
     }
     
-    logger.warning(f"Security event: {event_data}")
+    logger.warning("Security event: %s", event_data)
     
     # Store in session for admin review
     if "security_events" not in st.session_state:
-        st.session_state.security_events = []
+        st.session_state.security_events = deque(maxlen=MAX_SECURITY_EVENTS)
     
     st.session_state.security_events.append(event_data)
\ No newline at end of file